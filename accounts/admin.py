@@ -1,12 +1,30 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from django.utils.html import format_html
+from django.utils.html import format_html, escape
+from django.utils.safestring import mark_safe
 from django.urls import reverse
-from django.db.models import Count
+from django.db import connection
+from django.db.models import CharField, F, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Concat, Trim
 from .models import CustomUser, JobSeeker, Recruiter, Experience, Education, Skill
 from .forms import CustomUserCreationForm, CustomUserChangeForm
 
 
+def full_name_expression(prefix=''):
+    """SQL "first last" name, trimmed – annotate it to sort/display names in the DB"""
+    return Trim(Concat(
+        F(f'{prefix}first_name'), Value(' '), F(f'{prefix}last_name'),
+        output_field=CharField(),
+    ))
+
+
+def is_changelist(request):
+    """True when the admin request is rendering a changelist page"""
+    match = request.resolver_match
+    return match is not None and match.url_name.endswith('_changelist')
+
+
 # ========== INLINE CLASSES ==========
 class ExperienceInline(admin.TabularInline):
     model = Experience
@@ -18,6 +36,10 @@ class ExperienceInline(admin.TabularInline):
     show_change_link = True
     max_num = 0
 
+    def get_queryset(self, request):
+        # Only the columns rendered in the inline – skips description TextFields
+        return super().get_queryset(request).only('job_seeker', *self.fields)
+
 
 class EducationInline(admin.TabularInline):
     model = Education
@@ -29,6 +51,10 @@ class EducationInline(admin.TabularInline):
     show_change_link = True
     max_num = 0
 
+    def get_queryset(self, request):
+        # Only the columns rendered in the inline – skips description TextFields
+        return super().get_queryset(request).only('job_seeker', *self.fields)
+
 
 class SkillInline(admin.TabularInline):
     model = Skill
@@ -40,6 +66,29 @@ class SkillInline(admin.TabularInline):
     show_change_link = True
     max_num = 0
 
+    def get_queryset(self, request):
+        # Only the columns rendered in the inline – skips description TextFields
+        return super().get_queryset(request).only('job_seeker', *self.fields)
+
+
+# ========== BADGE FRAGMENTS ==========
+# Built once at import – the badge markup only varies by role/status
+_BADGE_STYLE = 'color: white; padding: 3px 10px; border-radius: 20px; font-size: 0.8em;'
+
+_ROLE_HTML = {
+    role: mark_safe(
+        f'<span style="background-color: {color}; {_BADGE_STYLE}">{label}</span>'
+    )
+    for role, color, label in (
+        (CustomUser.Roles.ADMIN, 'purple', CustomUser.Roles.ADMIN.label),
+        (CustomUser.Roles.RECRUITER, 'blue', CustomUser.Roles.RECRUITER.label),
+        (CustomUser.Roles.JOBSEEKER, 'green', CustomUser.Roles.JOBSEEKER.label),
+    )
+}
+
+_ACTIVE_HTML = mark_safe(f'<span style="background-color: #28a745; {_BADGE_STYLE}">✅ Active</span>')
+_INACTIVE_HTML = mark_safe(f'<span style="background-color: #dc3545; {_BADGE_STYLE}">⛔ Inactive</span>')
+
 
 # ========== CUSTOM USER ADMIN ==========
 @admin.register(CustomUser)
@@ -84,40 +133,38 @@ class CustomUserAdmin(UserAdmin):
     )
 
     def full_name(self, obj):
-        name = f"{obj.first_name} {obj.last_name}".strip()
-        return name if name else "—"
+        return obj.full_name_str or "—"
     full_name.short_description = 'Name'
+    full_name.admin_order_field = 'full_name_str'
 
     def role_badge(self, obj):
-        colors = {
-            'admin': 'purple',
-            'recruiter': 'blue',
-            'job_seeker': 'green',
-        }
-        color = colors.get(obj.role, 'gray')
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 10px; border-radius: 20px; font-size: 0.8em;">{}</span>',
-            color,
-            obj.get_role_display()
-        )
+        badge = _ROLE_HTML.get(obj.role)
+        if badge is None:
+            badge = format_html(
+                '<span style="background-color: gray; {}">{}</span>', _BADGE_STYLE, obj.role
+            )
+        return badge
     role_badge.short_description = 'Role'
+    role_badge.admin_order_field = 'role'
 
     def status_badge(self, obj):
-        if obj.is_active:
-            return format_html(
-                '<span style="background-color: #28a745; color: white; padding: 3px 10px; border-radius: 20px; font-size: 0.8em;">✅ Active</span>'
-            )
-        return format_html(
-            '<span style="background-color: #dc3545; color: white; padding: 3px 10px; border-radius: 20px; font-size: 0.8em;">⛔ Inactive</span>'
-        )
+        return _ACTIVE_HTML if obj.is_active else _INACTIVE_HTML
     status_badge.short_description = 'Status'
+    status_badge.admin_order_field = 'is_active'
 
     def joined_date(self, obj):
-        return obj.date_joined.strftime('%b %d, %Y')
+        joined = getattr(obj, 'joined_str', None)
+        return joined if joined is not None else obj.date_joined.strftime('%b %d, %Y')
     joined_date.short_description = 'Joined'
     joined_date.admin_order_field = 'date_joined'
 
-    # No get_queryset override – we don't need joins for the displayed fields
+    def get_queryset(self, request):
+        # No joins needed for the displayed fields; on PostgreSQL the join
+        # date is pre-formatted by to_char instead of strftime per row
+        qs = super().get_queryset(request).annotate(full_name_str=full_name_expression())
+        if connection.vendor == 'postgresql' and is_changelist(request):
+            qs = qs.annotate(joined_str=RawSQL("to_char(date_joined, 'Mon DD, YYYY')", []))
+        return qs
 
 
 # ========== JOB SEEKER ADMIN ==========
@@ -152,28 +199,27 @@ class JobSeekerAdmin(admin.ModelAdmin):
     show_full_result_count = False          # ⬅️ Eliminates duplicate COUNT(*)
 
     def name(self, obj):
-        return f"{obj.user.first_name} {obj.user.last_name}".strip() or obj.user.email
+        return obj.full_name_str or obj.user.email
     name.short_description = 'Name'
+    name.admin_order_field = 'full_name_str'
 
     def email(self, obj):
         return obj.user.email
     email.short_description = 'Email'
 
     def quick_stats(self, obj):
-        # Uses annotated fields from get_queryset – no extra queries!
+        # Reads the denormalized counters – no joins or extra queries!
         return format_html(
             '<span title="{} experiences, {} education, {} skills">💼 {} | 🎓 {} | ⚡ {}</span>',
-            obj.exp_count, obj.edu_count, obj.skill_count,
-            obj.exp_count, obj.edu_count, obj.skill_count
+            obj.experiences_count, obj.educations_count, obj.skills_count,
+            obj.experiences_count, obj.educations_count, obj.skills_count
         )
     quick_stats.short_description = 'Stats'
 
     def get_queryset(self, request):
-        # ⬅️ OPTIMIZED: select user and annotate counts to avoid N+1 queries
+        # ⬅️ OPTIMIZED: select user to avoid N+1; counts live on the row itself
         return super().get_queryset(request).select_related('user').annotate(
-            exp_count=Count('experiences', distinct=True),
-            edu_count=Count('educations', distinct=True),
-            skill_count=Count('skills', distinct=True)
+            full_name_str=full_name_expression('user__')
         )
 
 
@@ -213,17 +259,26 @@ class RecruiterAdmin(admin.ModelAdmin):
     show_full_result_count = False          # ⬅️ Eliminates duplicate COUNT(*)
 
     def name(self, obj):
-        return f"{obj.user.first_name} {obj.user.last_name}".strip() or obj.user.email
+        return obj.full_name_str or obj.user.email
     name.short_description = 'Name'
+    name.admin_order_field = 'full_name_str'
 
     def email(self, obj):
         return obj.user.email
     email.short_description = 'Email'
 
+    # Change-page URL with a {} placeholder for the id, resolved on first use
+    # (the URLconf isn't loaded yet when this module is imported)
+    _company_url = None
+
     def company_link(self, obj):
-        if obj.company:
-            url = reverse('admin:companies_company_change', args=[obj.company.id])
-            return format_html('<a href="{}">{}</a>', url, obj.company.name)
+        if obj.company_id:
+            if RecruiterAdmin._company_url is None:
+                RecruiterAdmin._company_url = reverse(
+                    'admin:companies_company_change', args=[0]
+                ).replace('/0/', '/{}/')
+            url = RecruiterAdmin._company_url.format(obj.company_id)
+            return mark_safe(f'<a href="{url}">{escape(obj.company.name)}</a>')
         return "—"
     company_link.short_description = 'Company'
 
@@ -233,7 +288,13 @@ class RecruiterAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         # ⬅️ OPTIMIZED: select user and company to avoid N+1
-        return super().get_queryset(request).select_related('user', 'company')
+        qs = super().get_queryset(request).select_related('user', 'company').annotate(
+            full_name_str=full_name_expression('user__')
+        )
+        if is_changelist(request):
+            # Skip password/bio/picture columns of the joined rows
+            qs = qs.only('designation', 'phone_number', 'company__name', 'user__email')
+        return qs
 
 
 # ========== EXPERIENCE ADMIN ==========
@@ -264,7 +325,14 @@ class ExperienceAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         # ⬅️ OPTIMIZED: select related job_seeker and its user to avoid N+1
-        return super().get_queryset(request).select_related('job_seeker__user')
+        qs = super().get_queryset(request).select_related('job_seeker__user')
+        if is_changelist(request):
+            # Only the displayed columns – skips description and profile TextFields
+            qs = qs.only(
+                'title', 'company', 'start_date', 'end_date', 'currently_working',
+                'job_seeker__user__email',
+            )
+        return qs
 
 
 # ========== EDUCATION ADMIN ==========
@@ -294,7 +362,13 @@ class EducationAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         # ⬅️ OPTIMIZED: select related job_seeker and its user
-        return super().get_queryset(request).select_related('job_seeker__user')
+        qs = super().get_queryset(request).select_related('job_seeker__user')
+        if is_changelist(request):
+            qs = qs.only(
+                'degree', 'institution', 'start_date', 'end_date', 'currently_studying',
+                'job_seeker__user__email',
+            )
+        return qs
 
 
 # ========== SKILL ADMIN ==========
@@ -317,4 +391,7 @@ class SkillAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         # ⬅️ OPTIMIZED: select related job_seeker and its user to eliminate N+1 queries
-        return super().get_queryset(request).select_related('job_seeker__user')
\ No newline at end of file
+        qs = super().get_queryset(request).select_related('job_seeker__user')
+        if is_changelist(request):
+            qs = qs.only('name', 'proficiency', 'job_seeker__user__email')
+        return qs
\ No newline at end of file
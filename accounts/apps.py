@@ -6,4 +6,9 @@ class AccountsConfig(AppConfig):
     name = 'accounts'
     
     def ready(self):
-        import accounts.signals
\ No newline at end of file
+        import accounts.signals
+        from django.contrib.auth.models import update_last_login
+        from django.contrib.auth.signals import user_logged_in
+
+        # accounts.signals writes last_login together with the activity fields
+        user_logged_in.disconnect(update_last_login, dispatch_uid="update_last_login")
\ No newline at end of file
@@ -0,0 +1,13 @@
+# accounts/hashers.py
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with a lighter memory/parallelism profile than Django's defaults.
+
+    Keeps the "argon2" algorithm name, so hashes stay readable by the stock
+    Argon2PasswordHasher.
+    """
+    time_cost = 2
+    memory_cost = 65536  # KiB (64 MiB)
+    parallelism = 4
@@ -1,23 +1,65 @@
 # accounts/management/commands/cleanup_online_status.py
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.core.cache import cache
+from django.db.models import Case, When, Value, DateTimeField
 from django.utils import timezone
 from django.contrib.auth import get_user_model
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
+from itertools import islice
+
+from accounts.models import activity_cache_key
 
 User = get_user_model()
 
+BATCH_SIZE = 1000
+
 class Command(BaseCommand):
     help = 'Clean up stale online statuses'
 
+    def flush_buffered_activity(self):
+        """Persist activity timestamps buffered in the cache by the middleware"""
+        if not settings.CACHE_IS_SHARED:
+            # The middleware writes through when the cache is per-process
+            return 0
+
+        online_ids = list(User.objects.filter(is_online=True).values_list('id', flat=True))
+        if not online_ids:
+            return 0
+
+        keys = {activity_cache_key(user_id): user_id for user_id in online_ids}
+        buffered = cache.get_many(keys.keys())
+        if not buffered:
+            return 0
+
+        # One UPDATE for the whole batch, each row getting its own timestamp
+        whens = [
+            When(id=keys[key], then=Value(datetime.fromtimestamp(ts, tz=dt_timezone.utc)))
+            for key, ts in buffered.items()
+        ]
+        return User.objects.filter(id__in=[keys[key] for key in buffered]).update(
+            last_activity=Case(*whens, output_field=DateTimeField())
+        )
+
     def handle(self, *args, **options):
+        flushed = self.flush_buffered_activity()
+
         # Mark users as offline if they haven't been active in 10 minutes
         threshold = timezone.now() - timedelta(minutes=10)
         
-        updated = User.objects.filter(
+        # Stream just the ids and flip them in batches – bounded memory and
+        # short UPDATE lock windows however many users went stale
+        stale_ids = User.objects.filter(
             is_online=True,
             last_activity__lt=threshold
-        ).update(is_online=False)
-        
+        ).values_list('id', flat=True).iterator(chunk_size=5000)
+
+        updated = 0
+        while batch := list(islice(stale_ids, BATCH_SIZE)):
+            updated += User.objects.filter(id__in=batch).update(is_online=False)
+
         self.stdout.write(
-            self.style.SUCCESS(f'Successfully marked {updated} users as offline')
-        )
\ No newline at end of file
+            self.style.SUCCESS(
+                f'Flushed activity for {flushed} users, marked {updated} users as offline'
+            )
+        )
@@ -1,14 +1,40 @@
-from django.utils import timezone
+import time
+
+from django.conf import settings
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
 from django.utils.deprecation import MiddlewareMixin
 
+from .models import ACTIVITY_CACHE_TIMEOUT, activity_cache_key
+
 User = get_user_model()
 
+# Asset and health-check requests don't reflect real user activity
+SKIP_PREFIXES = ('/admin/', '/static/', '/media/', '/healthz', '/favicon.ico')
+SKIP_SUFFIXES = ('.css', '.js', '.map', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.woff', '.woff2')
+
+# get_online_status uses a 5 minute window, so recording activity more than
+# once a minute per user buys nothing
+ACTIVITY_THROTTLE_SECONDS = 60
+
 class UpdateLastActivityMiddleware(MiddlewareMixin):
     def process_response(self, request, response):
-        if request.user.is_authenticated and not request.path.startswith('/admin/'):
-            User.objects.filter(id=request.user.id).update(
-                last_activity=timezone.now(),
-                is_online=True
-            )
-        return response
\ No newline at end of file
+        path = request.path
+        if path.startswith(SKIP_PREFIXES) or path.endswith(SKIP_SUFFIXES):
+            return response
+
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            # cache.add is a no-op while the throttle key is still alive
+            if not cache.add(f"activity_seen:{user.id}", 1, ACTIVITY_THROTTLE_SECONDS):
+                return response
+            if settings.CACHE_IS_SHARED:
+                # Buffer the timestamp in the cache; cleanup_online_status flushes it
+                cache.set(activity_cache_key(user.id), time.time(), ACTIVITY_CACHE_TIMEOUT)
+                # Only hit the database when the user comes back online
+                if user.is_online:
+                    return response
+            # A per-process cache is invisible to other workers and to the
+            # flush, so write the (throttled) activity straight through
+            User.bulk_mark_active([user.id])
+        return response
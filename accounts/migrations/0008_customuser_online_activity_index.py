@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_customuser_is_online_customuser_last_activity'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['is_online', 'last_activity'], name='user_online_act_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:31
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_profile_counters(apps, schema_editor):
+    JobSeeker = apps.get_model('accounts', 'JobSeeker')
+    counters = {
+        'experiences_count': apps.get_model('accounts', 'Experience'),
+        'educations_count': apps.get_model('accounts', 'Education'),
+        'skills_count': apps.get_model('accounts', 'Skill'),
+    }
+    updates = {}
+    for field, model in counters.items():
+        counts = (
+            model.objects.filter(job_seeker=OuterRef('pk'))
+            .order_by()
+            .values('job_seeker')
+            .annotate(total=Count('pk'))
+            .values('total')
+        )
+        updates[field] = Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+    JobSeeker.objects.update(**updates)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_customuser_online_activity_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobseeker',
+            name='educations_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobseeker',
+            name='experiences_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobseeker',
+            name='skills_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_profile_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_jobseeker_profile_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['role', 'is_active', '-date_joined'], name='user_role_active_joined_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recruiter',
+            index=models.Index(fields=['company', 'designation'], name='recruiter_company_desig_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['proficiency'], name='skill_proficiency_idx'),
+        ),
+    ]
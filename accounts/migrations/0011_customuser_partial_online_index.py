@@ -0,0 +1,21 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_admin_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='customuser',
+            name='user_online_act_idx',
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(condition=models.Q(('is_online', True)), fields=['last_activity'], name='online_last_act_idx'),
+        ),
+    ]
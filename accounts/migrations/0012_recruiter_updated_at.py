@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_customuser_partial_online_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recruiter',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
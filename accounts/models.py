@@ -1,9 +1,31 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
 from django.db import models
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.core.cache import cache
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from companies.models import Company  # Import the Company model
 
+# Activity timestamps are buffered in the (shared) cache by
+# UpdateLastActivityMiddleware and flushed to the database by the
+# cleanup_online_status command, which the accounts.tasks beat entry runs.
+ACTIVITY_CACHE_TIMEOUT = 600  # 10 minutes
+ONLINE_WINDOW = timedelta(minutes=5)
+
+
+def activity_cache_key(user_id):
+    return f"last_activity:{user_id}"
+
+
+def current_recruiter_cache_key(user_id):
+    return f"current_recruiter:{user_id}"
+
+
+def public_recruiter_cache_key(recruiter_id):
+    return f"public_recruiter:{recruiter_id}"
+
+
 class CustomUserManager(BaseUserManager):
     def create_user(self, email, password, **extra_fields):
         if not email:
@@ -38,19 +60,59 @@ class CustomUser(AbstractUser):
     REQUIRED_FIELDS = []
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Partial index: only the small online subset is indexed
+            models.Index(
+                fields=['last_activity'],
+                name='online_last_act_idx',
+                condition=models.Q(is_online=True),
+            ),
+            models.Index(fields=['role', 'is_active', '-date_joined'], name='user_role_active_joined_idx'),
+        ]
+
     def update_activity(self):
-        """Update user's last activity time"""
-        self.last_activity = timezone.now()
+        """Update user's last activity time (queryset UPDATE – no save signals)"""
+        now = timezone.now()
+        type(self).objects.filter(pk=self.pk).update(last_activity=now, is_online=True)
+        self.last_activity = now
         self.is_online = True
-        self.save(update_fields=['last_activity', 'is_online'])
+
+    @classmethod
+    def bulk_mark_active(cls, user_ids):
+        """Mark many users active with a single UPDATE"""
+        return cls.objects.filter(id__in=user_ids).update(
+            last_activity=timezone.now(),
+            is_online=True
+        )
     
+    @classmethod
+    def with_online_flag(cls, queryset=None):
+        """Annotate ``online_now`` in SQL (last_activity within the online window)"""
+        if queryset is None:
+            queryset = cls.objects.all()
+        return queryset.annotate(
+            online_now=models.Case(
+                models.When(last_activity__gt=timezone.now() - ONLINE_WINDOW, then=models.Value(True)),
+                default=models.Value(False),
+                output_field=models.BooleanField(),
+            )
+        )
+
+    def get_last_activity(self):
+        """Latest activity time, preferring the buffered value in the cache"""
+        buffered = cache.get(activity_cache_key(self.pk))
+        if buffered is not None:
+            return datetime.fromtimestamp(buffered, tz=dt_timezone.utc)
+        return self.last_activity
+
     def get_online_status(self):
         """Check if user is considered online (active in last 5 minutes)"""
-        if not self.last_activity:
+        last_activity = self.get_last_activity()
+        if not last_activity:
             return False
         # Consider online if last activity within last 5 minutes
-        time_diff = timezone.now() - self.last_activity
-        return time_diff.total_seconds() < 300  # 5 minutes
+        return timezone.now() - last_activity < ONLINE_WINDOW
     
 # Update JobSeeker model with new fields
 class JobSeeker(models.Model):
@@ -70,6 +132,10 @@ class JobSeeker(models.Model):
     portfolio_url = models.URLField(blank=True)
     github_url = models.URLField(blank=True)
     linkedin_url = models.URLField(blank=True)
+    # Counter cache maintained by signals in accounts/signals.py
+    experiences_count = models.PositiveIntegerField(default=0, editable=False)
+    educations_count = models.PositiveIntegerField(default=0, editable=False)
+    skills_count = models.PositiveIntegerField(default=0, editable=False)
 
     def clean(self):
         if self.user.role != CustomUser.Roles.JOBSEEKER:
@@ -139,6 +205,9 @@ class Skill(models.Model):
 
     class Meta:
         unique_together = ['job_seeker', 'name']
+        indexes = [
+            models.Index(fields=['proficiency'], name='skill_proficiency_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -170,6 +239,12 @@ class Recruiter(models.Model):
     )
     bio = models.TextField(blank=True, help_text="Recruiter bio/introduction")
     department = models.CharField(max_length=100, blank=True, help_text="Department")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['company', 'designation'], name='recruiter_company_desig_idx'),
+        ]
 
     def __str__(self):
         # Access company name through the relationship
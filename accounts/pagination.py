@@ -0,0 +1,13 @@
+# accounts/pagination.py
+from rest_framework.pagination import PageNumberPagination
+
+
+class OptionalPageNumberPagination(PageNumberPagination):
+    """Paginate only when the client sends ?page_size=N.
+
+    Without it the view returns the plain list it always has, so existing
+    clients are unaffected.
+    """
+    page_size = None
+    page_size_query_param = 'page_size'
+    max_page_size = 100
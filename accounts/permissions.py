@@ -0,0 +1,28 @@
+# accounts/permissions.py
+import logging
+from rest_framework.permissions import IsAuthenticated
+
+logger = logging.getLogger(__name__)
+
+
+class HasRole(IsAuthenticated):
+    """Authenticated user with a specific role (checked before any view code runs)"""
+    role = None
+
+    def has_permission(self, request, view):
+        if not super().has_permission(request, view):
+            return False
+        if request.user.role == self.role:
+            return True
+        logger.warning("User %s (%s) denied access to %s", request.user.id, request.user.role, view.__class__.__name__)
+        return False
+
+
+class IsJobSeeker(HasRole):
+    role = 'job_seeker'
+    message = {"error": "User is not a job seeker"}
+
+
+class IsRecruiter(HasRole):
+    role = 'recruiter'
+    message = {"error": "User is not a recruiter"}
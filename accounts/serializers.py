@@ -1,3 +1,5 @@
+import copy
+
 from rest_framework import serializers
 from .models import JobSeeker, Recruiter, Company, Skill, Education, Experience
 from companies.models import Company
@@ -5,10 +7,14 @@ from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth import get_user_model, authenticate
 from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 
 User = get_user_model()
 
+VALID_ROLES = frozenset(User.Roles.values)
+
 # accounts/serializers.py - Fix the UserRegistrationSerializer validation
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -40,18 +46,23 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         is_existing_user = data.get('is_existing_user', False)
         
         # Validate role
-        valid_roles = [choice[0] for choice in User.Roles.choices]
-        if role not in valid_roles:
+        if role not in VALID_ROLES:
             raise serializers.ValidationError({
-                'error': f'Invalid role. Must be one of: {valid_roles}'
+                'error': f'Invalid role. Must be one of: {User.Roles.values}'
             })
         
-        # Check if user exists
-        user_exists = User.objects.filter(email=email).exists()
+        # Check if user exists – one query, only the user columns used below,
+        # with the profiles joined so a role change knows what to delete. The
+        # profiles load in full, so delete receivers never lazy-load a deferred
+        # field from a row that is already gone
+        existing_user = User.objects.filter(email=email).select_related(
+            'seeker_profile', 'recruiter'
+        ).only(
+            'id', 'email', 'role', 'first_name', 'last_name',
+            'seeker_profile', 'recruiter'
+        ).first()
         
-        if user_exists:
-            existing_user = User.objects.get(email=email)
-            
+        if existing_user:
             # If user is checking if they exist (frontend logic)
             if is_existing_user:
                 # Verify password
@@ -69,6 +80,8 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
                 
                 # Allow role change
                 data['existing_user'] = existing_user
+                if role == 'recruiter':
+                    data['company'] = self._get_company(data.get('company'))
                 return data
             
             else:
@@ -77,17 +90,15 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
                     'error': f'User with this email already exists as {existing_user.role}'
                 })
         
+        elif is_existing_user:
+            # Run the password hasher anyway so a missing account takes as long
+            # to reject as a wrong password (same trick as Django's ModelBackend)
+            User().set_password(password or '')
+        
         # New user validation - ONLY require company for recruiters
         if role == 'recruiter':
-            company = data.get('company')
-            if not company:
-                raise serializers.ValidationError({
-                    'error': 'Company is required for recruiters'
-                })
-            if not Company.objects.filter(id=company).exists():
-                raise serializers.ValidationError({
-                    'error': 'Company does not exist'
-                })
+            # Hand the fetched instance to create() instead of re-querying it
+            data['company'] = self._get_company(data.get('company'))
             if not data.get('designation'):
                 raise serializers.ValidationError({
                     'error': 'Designation is required for recruiters'
@@ -101,19 +112,32 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         
         return data
     
+    def _get_company(self, company_id):
+        """Fetch the recruiter's company once, during validation"""
+        if not company_id:
+            raise serializers.ValidationError({
+                'error': 'Company is required for recruiters'
+            })
+        company = Company.objects.filter(id=company_id).first()
+        if company is None:
+            raise serializers.ValidationError({
+                'error': 'Company does not exist'
+            })
+        return company
+    
     @transaction.atomic
     def create(self, validated_data):
-        is_existing_user = validated_data.pop('is_existing_user', False)
+        validated_data.pop('is_existing_user', None)
         existing_user = validated_data.pop('existing_user', None)
         
         # Extract profile data
         phone_number = validated_data.pop('phone_number')
         location = validated_data.pop('location', '')
-        company_id = validated_data.pop('company', None)  # Will be None for job seekers
+        company = validated_data.pop('company', None)  # Company instance for recruiters, None for job seekers
         designation = validated_data.pop('designation', '')
         role = validated_data.get('role')
         
-        if is_existing_user and existing_user:
+        if existing_user:
             # Handle role change for existing user
             user = existing_user
             
@@ -121,14 +145,15 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             user.first_name = validated_data.get('first_name', user.first_name)
             user.last_name = validated_data.get('last_name', user.last_name)
             user.role = role
-            user.save()
+            user.save(update_fields=['first_name', 'last_name', 'role'])
             
-            # Delete old profile if exists
+            # Delete old profile if exists (already joined in validate()); the
+            # new profile is cached back onto the user for the view's response
             if role == 'recruiter':
                 # Remove old job seeker profile
-                JobSeeker.objects.filter(user=user).delete()
-                company = Company.objects.get(id=company_id)
-                Recruiter.objects.update_or_create(
+                if hasattr(user, 'seeker_profile'):
+                    user.seeker_profile.delete()
+                user.recruiter, _ = Recruiter.objects.update_or_create(
                     user=user,
                     defaults={
                         'company': company,
@@ -138,8 +163,9 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
                 )
             elif role == 'job_seeker':
                 # Remove old recruiter profile
-                Recruiter.objects.filter(user=user).delete()
-                JobSeeker.objects.update_or_create(
+                if hasattr(user, 'recruiter'):
+                    user.recruiter.delete()
+                user.seeker_profile, _ = JobSeeker.objects.update_or_create(
                     user=user,
                     defaults={
                         'phone_number': phone_number,
@@ -161,7 +187,6 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
                     location=location
                 )
             elif role == 'recruiter':
-                company = Company.objects.get(id=company_id)
                 Recruiter.objects.create(
                     user=user,
                     company=company,
@@ -171,6 +196,17 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             
             return user
 
+def get_recruiter_for_token(user):
+    """Recruiter profile with its company name, fetched once per user instance"""
+    try:
+        return user._token_recruiter
+    except AttributeError:
+        user._token_recruiter = Recruiter.objects.select_related('company').only(
+            'designation', 'company__name'
+        ).filter(user_id=user.id).first()
+        return user._token_recruiter
+
+
 class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         data = super().validate(attrs)
@@ -183,10 +219,12 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
             'user_id': self.user.id,
         })
         
-        # Add role-specific data if needed
-        if self.user.role == 'recruiter' and hasattr(self.user, 'recruiter'):
-            data['company'] = self.user.recruiter.company.name
-            data['designation'] = self.user.recruiter.designation
+        # Add role-specific data if needed – one query for profile + company
+        if self.user.role == 'recruiter':
+            recruiter = get_recruiter_for_token(self.user)
+            if recruiter is not None:
+                data['company'] = recruiter.company.name
+                data['designation'] = recruiter.designation
         
         return data
 
@@ -196,6 +234,14 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
         # Add role to JWT payload
         token['role'] = user.role
         token['email'] = user.email
+        token['full_name'] = user.get_full_name()
+        # Copied into every access token minted from this refresh token, so
+        # clients can read them without calling back into the API
+        if user.role == 'recruiter':
+            recruiter = get_recruiter_for_token(user)
+            if recruiter is not None:
+                token['company_id'] = recruiter.company_id
+                token['designation'] = recruiter.designation
         return token
     
     
@@ -245,20 +291,34 @@ class CurrentRecruiterSerializer(serializers.ModelSerializer):
 
 # Add to accounts/serializers.py, after the existing serializers
 
-class UserBasicSerializer(serializers.ModelSerializer):
+class CachedModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer that introspects the model only once per class.
+
+    The first instance builds the fields as usual and keeps them on the class;
+    later instances get a deep copy, the same way DRF copies declared fields,
+    so bound state (parent/context) is never shared. Only for serializers
+    whose field set doesn't depend on the request/context.
+    """
+    def get_fields(self):
+        cls = type(self)
+        prototype = cls.__dict__.get('_cached_fields')
+        if prototype is None:
+            prototype = super().get_fields()
+            cls._cached_fields = prototype
+        return copy.deepcopy(prototype)
+
+
+class UserBasicSerializer(CachedModelSerializer):
     """Basic user information serializer"""
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.CharField(source='get_full_name', read_only=True)
     
     class Meta:
         model = User
         fields = ['id', 'email', 'first_name', 'last_name', 'full_name', 'role']
         read_only_fields = fields
-    
-    def get_full_name(self, obj):
-        return obj.get_full_name()
 
 
-class RecruiterBasicSerializer(serializers.ModelSerializer):
+class RecruiterBasicSerializer(CachedModelSerializer):
     """Basic recruiter information serializer"""
     user = UserBasicSerializer(read_only=True)
     company_name = serializers.CharField(source='company.name', read_only=True)
@@ -268,7 +328,7 @@ class RecruiterBasicSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'company', 'company_name', 'designation', 'phone_number']
 
 
-class JobSeekerBasicSerializer(serializers.ModelSerializer):
+class JobSeekerBasicSerializer(CachedModelSerializer):
     """Basic job seeker information serializer"""
     user = UserBasicSerializer(read_only=True)
     
@@ -277,21 +337,21 @@ class JobSeekerBasicSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'phone_number', 'location', 'bio']
 
 
-class ExperienceSerializer(serializers.ModelSerializer):
+class ExperienceSerializer(CachedModelSerializer):
     class Meta:
         model = Experience
         fields = ['id', 'title', 'company', 'location', 'start_date', 
                  'end_date', 'currently_working', 'description']
         read_only_fields = ['id', 'job_seeker']
 
-class EducationSerializer(serializers.ModelSerializer):
+class EducationSerializer(CachedModelSerializer):
     class Meta:
         model = Education
         fields = ['id', 'degree', 'institution', 'field_of_study', 
                  'start_date', 'end_date', 'currently_studying', 'description']
         read_only_fields = ['id', 'job_seeker']
 
-class SkillSerializer(serializers.ModelSerializer):
+class SkillSerializer(CachedModelSerializer):
     class Meta:
         model = Skill
         fields = ['id', 'name', 'proficiency']
@@ -312,6 +372,11 @@ class JobSeekerProfileSerializer(serializers.ModelSerializer):
             'github_url', 'linkedin_url', 'experiences', 'educations', 'skills'
         ]
         read_only_fields = ['id', 'user']
+    
+    def to_representation(self, instance):
+        # No-op for relations the view already loaded; otherwise one query each
+        prefetch_related_objects([instance], 'user', 'experiences', 'educations', 'skills')
+        return super().to_representation(instance)
 
 class JobSeekerUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating job seeker profile"""
@@ -334,7 +399,7 @@ class RecruiterProfileSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(source='user.email', read_only=True)
     first_name = serializers.CharField(source='user.first_name', read_only=True)
     last_name = serializers.CharField(source='user.last_name', read_only=True)
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.CharField(source='user.get_full_name', read_only=True)
     company_details = serializers.SerializerMethodField()
     profile_completion = serializers.SerializerMethodField()
     
@@ -357,11 +422,17 @@ class RecruiterProfileSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'email', 'first_name', 'last_name']
     
-    def get_full_name(self, obj):
-        return obj.user.get_full_name()
+    def to_representation(self, instance):
+        # No-op for relations the view already loaded; otherwise one query each
+        prefetch_related_objects([instance], 'user', 'company')
+        return super().to_representation(instance)
     
     def get_company_details(self, obj):
         if obj.company:
+            # Annotated by the profile views; fall back to the COUNT property
+            total_recruiters = getattr(obj, 'company_total_recruiters', None)
+            if total_recruiters is None:
+                total_recruiters = obj.company.total_recruiters
             return {
                 'id': obj.company.id,
                 'name': obj.company.name,
@@ -383,14 +454,17 @@ class RecruiterProfileSerializer(serializers.ModelSerializer):
                 'perks': obj.company.perks,
                 'culture_description': obj.company.culture_description,
                 'awards': obj.company.awards,
-                'total_recruiters': obj.company.total_recruiters,
+                'total_recruiters': total_recruiters,
             }
         return None
     
     def get_profile_completion(self, obj):
-        """Calculate recruiter profile completion"""
-        completion = calculate_recruiter_completion(obj)
-        return completion
+        """Calculate recruiter profile completion (cached per recruiter/company version)"""
+        return cache.get_or_set(
+            recruiter_completion_cache_key(obj),
+            lambda: calculate_recruiter_completion(obj),
+            RECRUITER_COMPLETION_CACHE_TIMEOUT
+        )
 
 class RecruiterUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating recruiter profile"""
@@ -430,167 +504,82 @@ class CompanyUpdateSerializer(serializers.ModelSerializer):
             'awards'
         ]
 
+def _has_text_over(min_length):
+    return lambda value: bool(value) and len(value) > min_length
+
+
+# One entry per checklist item:
+# (id, label, checklist field, on company?, attribute, weight, predicate)
+# Weights add up to 20 (recruiter) + 80 (company); company items only count
+# towards the total when the recruiter has a company.
+RECRUITER_COMPLETION_ITEMS = (
+    (1, 'Complete your recruiter bio', 'recruiter_bio', False, 'bio', 6.67, _has_text_over(30)),
+    (2, 'Add your designation', 'designation', False, 'designation', 6.67, bool),
+    (3, 'Add phone number', 'phone_number', False, 'phone_number', 6.67, bool),
+    (4, 'Complete company name', 'company_name', True, 'name', 10, bool),
+    (5, 'Add company description', 'company_description', True, 'description', 10, bool),
+    (6, 'Add company industry', 'company_industry', True, 'industry', 10, bool),
+    (7, 'Add company location', 'company_location', True, 'location', 10, bool),
+    (8, 'Add company website', 'company_website', True, 'website', 6.67, bool),
+    (9, 'Add company size', 'company_size', True, 'company_size', 6.67, bool),
+    (10, 'Add company contact email', 'company_email', True, 'email', 6.67, bool),
+    (11, 'Add LinkedIn URL', 'company_linkedin', True, 'linkedin_url', 10, bool),
+    (12, 'Add company perks', 'company_perks', True, 'perks', 5, bool),
+    (13, 'Describe company culture', 'company_culture', True, 'culture_description', 5, bool),
+)
+# Weights in hundredths of a point so the running sums stay exact integers
+_RECRUITER_COMPLETION_POINTS = tuple(round(item[5] * 100) for item in RECRUITER_COMPLETION_ITEMS)
+# Checklist entries with everything but 'completed' filled in, copied per call
+_RECRUITER_CHECKLIST_TEMPLATE = tuple(
+    {'id': item_id, 'label': label, 'completed': False, 'weight': weight, 'field': field}
+    for item_id, label, field, _, _, weight, _ in RECRUITER_COMPLETION_ITEMS
+)
+
+
+RECRUITER_COMPLETION_CACHE_TIMEOUT = 3600  # 1 hour
+
+
+def recruiter_completion_cache_key(recruiter):
+    """Versioned by updated_at, so any save of the recruiter or company changes the key"""
+    company = recruiter.company
+    company_version = company.updated_at.timestamp() if company else 0
+    return (
+        f"recruiter_completion:{recruiter.id}:{recruiter.updated_at.timestamp()}:"
+        f"{recruiter.company_id}:{company_version}"
+    )
+
+
 def calculate_recruiter_completion(recruiter):
     """Calculate profile completion percentage for recruiter"""
-    sections = {
-        'basic_info': ['phone_number', 'designation', 'bio'],
-        'company_basic': ['name', 'description', 'industry', 'location'],
-        'company_details': ['website', 'company_size', 'email'],
-        'company_social': ['linkedin_url'],
-        'company_culture': ['perks', 'culture_description']
-    }
-    
+    company = recruiter.company
     total_points = 0
     earned_points = 0
+    checklist = []
     
-    # Recruiter Basic Info (20% weight)
-    for field in sections['basic_info']:
-        total_points += 6.67
-        if field == 'bio':
-            if getattr(recruiter, field) and len(getattr(recruiter, field)) > 30:
-                earned_points += 6.67
-        elif getattr(recruiter, field):
-            earned_points += 6.67
-    
-    # Company Basic Info (40% weight)
-    if recruiter.company:
-        for field in sections['company_basic']:
-            total_points += 10
-            if getattr(recruiter.company, field):
-                earned_points += 10
-    
-    # Company Details (20% weight)
-    if recruiter.company:
-        for field in sections['company_details']:
-            total_points += 6.67
-            if getattr(recruiter.company, field):
-                earned_points += 6.67
-    
-    # Company Social (10% weight)
-    if recruiter.company:
-        for field in sections['company_social']:
-            total_points += 10
-            if getattr(recruiter.company, field):
-                earned_points += 10
-    
-    # Company Culture (10% weight)
-    if recruiter.company:
-        for field in sections['company_culture']:
-            total_points += 5
-            if field == 'perks':
-                if getattr(recruiter.company, field) and len(getattr(recruiter.company, field)) > 0:
-                    earned_points += 5
-            elif getattr(recruiter.company, field):
-                earned_points += 5
+    for (_, _, _, on_company, attr, _, predicate), points, template in zip(
+        RECRUITER_COMPLETION_ITEMS, _RECRUITER_COMPLETION_POINTS, _RECRUITER_CHECKLIST_TEMPLATE
+    ):
+        source = company if on_company else recruiter
+        completed = source is not None and predicate(getattr(source, attr))
+        if source is not None:
+            total_points += points
+            if completed:
+                earned_points += points
+        checklist.append({**template, 'completed': completed})
     
     percentage = (earned_points / total_points) * 100 if total_points > 0 else 0
     
-    # Get checklist
-    checklist = [
-        {
-            'id': 1,
-            'label': 'Complete your recruiter bio',
-            'completed': bool(recruiter.bio and len(recruiter.bio) > 30),
-            'weight': 6.67,
-            'field': 'recruiter_bio'
-        },
-        {
-            'id': 2,
-            'label': 'Add your designation',
-            'completed': bool(recruiter.designation),
-            'weight': 6.67,
-            'field': 'designation'
-        },
-        {
-            'id': 3,
-            'label': 'Add phone number',
-            'completed': bool(recruiter.phone_number),
-            'weight': 6.67,
-            'field': 'phone_number'
-        },
-        {
-            'id': 4,
-            'label': 'Complete company name',
-            'completed': bool(recruiter.company and recruiter.company.name),
-            'weight': 10,
-            'field': 'company_name'
-        },
-        {
-            'id': 5,
-            'label': 'Add company description',
-            'completed': bool(recruiter.company and recruiter.company.description),
-            'weight': 10,
-            'field': 'company_description'
-        },
-        {
-            'id': 6,
-            'label': 'Add company industry',
-            'completed': bool(recruiter.company and recruiter.company.industry),
-            'weight': 10,
-            'field': 'company_industry'
-        },
-        {
-            'id': 7,
-            'label': 'Add company location',
-            'completed': bool(recruiter.company and recruiter.company.location),
-            'weight': 10,
-            'field': 'company_location'
-        },
-        {
-            'id': 8,
-            'label': 'Add company website',
-            'completed': bool(recruiter.company and recruiter.company.website),
-            'weight': 6.67,
-            'field': 'company_website'
-        },
-        {
-            'id': 9,
-            'label': 'Add company size',
-            'completed': bool(recruiter.company and recruiter.company.company_size),
-            'weight': 6.67,
-            'field': 'company_size'
-        },
-        {
-            'id': 10,
-            'label': 'Add company contact email',
-            'completed': bool(recruiter.company and recruiter.company.email),
-            'weight': 6.67,
-            'field': 'company_email'
-        },
-        {
-            'id': 11,
-            'label': 'Add LinkedIn URL',
-            'completed': bool(recruiter.company and recruiter.company.linkedin_url),
-            'weight': 10,
-            'field': 'company_linkedin'
-        },
-        {
-            'id': 12,
-            'label': 'Add company perks',
-            'completed': bool(recruiter.company and recruiter.company.perks and len(recruiter.company.perks) > 0),
-            'weight': 5,
-            'field': 'company_perks'
-        },
-        {
-            'id': 13,
-            'label': 'Describe company culture',
-            'completed': bool(recruiter.company and recruiter.company.culture_description),
-            'weight': 5,
-            'field': 'company_culture'
-        }
-    ]
-    
     return {
         'percentage': round(percentage),
         'checklist': checklist
     }
 
 
-class PublicRecruiterProfileSerializer(serializers.ModelSerializer):
+class PublicRecruiterProfileSerializer(CachedModelSerializer):
     """Serializer for public recruiter profile (for job seekers)"""
     first_name = serializers.CharField(source='user.first_name', read_only=True)
     last_name = serializers.CharField(source='user.last_name', read_only=True)
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.CharField(source='user.get_full_name', read_only=True)
     company_name = serializers.CharField(source='company.name', read_only=True)
     
     class Meta:
@@ -607,7 +596,4 @@ class PublicRecruiterProfileSerializer(serializers.ModelSerializer):
             'company',
             'company_name'
         ]
-        read_only_fields = fields
-    
-    def get_full_name(self, obj):
-        return obj.user.get_full_name()
\ No newline at end of file
+        read_only_fields = fields
\ No newline at end of file
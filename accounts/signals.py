@@ -1,24 +1,128 @@
 # accounts/signals.py
+from datetime import timedelta
+
 from django.contrib.auth.signals import user_logged_in, user_logged_out
+from django.db.models import F, Q
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from companies.models import Company
+from .models import (
+    JobSeeker, Experience, Education, Skill, Recruiter,
+    current_recruiter_cache_key, public_recruiter_cache_key,
+)
 
 User = get_user_model()
 
-@receiver(user_logged_in)
+# Burst re-logins (e.g. SPA re-auth) within this window don't rewrite the row
+LOGIN_ACTIVITY_DEBOUNCE = timedelta(seconds=30)
+
+# Related model -> JobSeeker counter field it maintains
+PROFILE_COUNTERS = {
+    Experience: 'experiences_count',
+    Education: 'educations_count',
+    Skill: 'skills_count',
+}
+
+@receiver(user_logged_in, sender=User, dispatch_uid='accounts_user_logged_in')
 def user_logged_in_handler(sender, request, user, **kwargs):
-    """Update user activity on login"""
-    User.objects.filter(id=user.id).update(
-        last_activity=timezone.now(),
-        is_online=True
-    )
+    """Record last login and activity on login in a single UPDATE.
+
+    Replaces django.contrib.auth's update_last_login receiver (disconnected in
+    AccountsConfig.ready), which would otherwise write the same row again.
+    Burst re-logins within LOGIN_ACTIVITY_DEBOUNCE skip the write entirely.
+    """
+    now = timezone.now()
+    updated = User.objects.filter(id=user.id).filter(
+        Q(is_online=False)
+        | Q(last_login__isnull=True)
+        | Q(last_login__lt=now - LOGIN_ACTIVITY_DEBOUNCE)
+    ).update(last_login=now, last_activity=now, is_online=True)
+    if updated:
+        user.last_login = now
 
-@receiver(user_logged_out)
+@receiver(user_logged_out, sender=User, dispatch_uid='accounts_user_logged_out')
 def user_logged_out_handler(sender, request, user, **kwargs):
     """Update user activity on logout"""
     if user:
         User.objects.filter(id=user.id).update(
             last_activity=timezone.now(),
             is_online=False
-        )
\ No newline at end of file
+        )
+
+def _bump_profile_counter(instance, delta):
+    field = PROFILE_COUNTERS[type(instance)]
+    JobSeeker.objects.filter(pk=instance.job_seeker_id).update(**{field: F(field) + delta})
+
+@receiver(post_save, sender=Experience, dispatch_uid='accounts_experience_post_save')
+@receiver(post_save, sender=Education, dispatch_uid='accounts_education_post_save')
+@receiver(post_save, sender=Skill, dispatch_uid='accounts_skill_post_save')
+def profile_item_saved_handler(sender, instance, created, **kwargs):
+    """Increment the job seeker's counter cache for new profile items"""
+    if created:
+        _bump_profile_counter(instance, 1)
+
+@receiver(post_delete, sender=Experience, dispatch_uid='accounts_experience_post_delete')
+@receiver(post_delete, sender=Education, dispatch_uid='accounts_education_post_delete')
+@receiver(post_delete, sender=Skill, dispatch_uid='accounts_skill_post_delete')
+def profile_item_deleted_handler(sender, instance, **kwargs):
+    """Decrement the job seeker's counter cache for removed profile items"""
+    _bump_profile_counter(instance, -1)
+
+def _drop_current_recruiter_payloads(user_ids):
+    if settings.CURRENT_RECRUITER_CACHE_TIMEOUT:
+        cache.delete_many([current_recruiter_cache_key(user_id) for user_id in user_ids])
+
+def _drop_public_recruiter_profiles(recruiter_ids):
+    if settings.PUBLIC_RECRUITER_CACHE_TIMEOUT:
+        cache.delete_many([public_recruiter_cache_key(recruiter_id) for recruiter_id in recruiter_ids])
+
+@receiver(post_save, sender=User, dispatch_uid='accounts_user_current_recruiter_cache')
+def user_recruiter_cache_handler(sender, instance, **kwargs):
+    """Drop the cached recruiter payloads that embed this user's name/email/active flag"""
+    _drop_current_recruiter_payloads([instance.pk])
+    if instance.role == 'recruiter' and settings.PUBLIC_RECRUITER_CACHE_TIMEOUT:
+        _drop_public_recruiter_profiles(
+            Recruiter.objects.filter(user_id=instance.pk).values_list('id', flat=True)
+        )
+
+@receiver(pre_save, sender=Recruiter, dispatch_uid='accounts_recruiter_company_before_save')
+def recruiter_company_before_save_handler(sender, instance, update_fields=None, **kwargs):
+    """Remember the stored company, so a move can refresh both companies' colleagues"""
+    if not instance.pk or not settings.PUBLIC_RECRUITER_CACHE_TIMEOUT:
+        return
+    if update_fields is not None and 'company' not in update_fields:
+        return
+    instance._stored_company_id = (
+        Recruiter.objects.filter(pk=instance.pk).values_list('company_id', flat=True).first()
+    )
+
+@receiver(post_save, sender=Recruiter, dispatch_uid='accounts_recruiter_saved_current_recruiter_cache')
+@receiver(post_delete, sender=Recruiter, dispatch_uid='accounts_recruiter_deleted_current_recruiter_cache')
+def recruiter_cache_handler(sender, instance, created=False, **kwargs):
+    """Drop the cached payloads for this recruiter; joining, leaving or switching
+    a company also changes the recruiter count shown on colleagues' public profiles"""
+    _drop_current_recruiter_payloads([instance.user_id])
+    recruiter_ids = [instance.pk]
+    if created or kwargs['signal'] is post_delete:
+        company_ids = {instance.company_id}
+    else:
+        stored_company_id = instance.__dict__.pop('_stored_company_id', instance.company_id)
+        company_ids = {stored_company_id, instance.company_id} if stored_company_id != instance.company_id else set()
+    company_ids.discard(None)
+    if company_ids and settings.PUBLIC_RECRUITER_CACHE_TIMEOUT:
+        recruiter_ids += Recruiter.objects.filter(company_id__in=company_ids).values_list('id', flat=True)
+    _drop_public_recruiter_profiles(recruiter_ids)
+
+@receiver(post_save, sender=Company, dispatch_uid='accounts_company_current_recruiter_cache')
+def company_recruiter_cache_handler(sender, instance, **kwargs):
+    """Company details are embedded too, so drop every recruiter's cached payloads"""
+    if not (settings.CURRENT_RECRUITER_CACHE_TIMEOUT or settings.PUBLIC_RECRUITER_CACHE_TIMEOUT):
+        return
+    recruiters = list(Recruiter.objects.filter(company=instance).values_list('id', 'user_id'))
+    _drop_current_recruiter_payloads([user_id for _, user_id in recruiters])
+    _drop_public_recruiter_profiles([recruiter_id for recruiter_id, _ in recruiters])
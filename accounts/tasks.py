@@ -0,0 +1,9 @@
+# accounts/tasks.py
+from celery import shared_task
+from django.core.management import call_command
+
+
+@shared_task
+def cleanup_online_status():
+    """Flush buffered activity to the database and mark idle users offline"""
+    call_command('cleanup_online_status')
@@ -1,3 +1,189 @@
-from django.test import TestCase
+from datetime import date
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from companies.models import Company
+from .models import CustomUser, JobSeeker, Recruiter, Experience, Education, Skill
+
+PASSWORD = 'Sup3r-secret-pass'
+
+
+def make_company(name='Acme'):
+    return Company.objects.create(name=name, description='Widgets', industry='Technology', location='Kathmandu')
+
+
+class ProfileCounterTests(TestCase):
+    """JobSeeker's *_count columns follow Experience/Education/Skill rows (accounts.signals)"""
+
+    def setUp(self):
+        user = CustomUser.objects.create_user('seeker@example.com', PASSWORD, role='job_seeker')
+        self.seeker = JobSeeker.objects.create(user=user, phone_number='9800000000')
+
+    def assertCounts(self, experiences, educations, skills):
+        self.seeker.refresh_from_db()
+        self.assertEqual(
+            (self.seeker.experiences_count, self.seeker.educations_count, self.seeker.skills_count),
+            (experiences, educations, skills),
+        )
+
+    def test_create_and_delete_update_counters(self):
+        experience = Experience.objects.create(
+            job_seeker=self.seeker, title='Engineer', company='Acme', start_date=date(2020, 1, 1)
+        )
+        Experience.objects.create(job_seeker=self.seeker, title='Lead', company='Acme', start_date=date(2022, 1, 1))
+        education = Education.objects.create(
+            job_seeker=self.seeker, degree='BSc', institution='TU', start_date=date(2015, 1, 1)
+        )
+        skill = Skill.objects.create(job_seeker=self.seeker, name='Python', proficiency='advanced')
+        self.assertCounts(2, 1, 1)
+
+        experience.delete()
+        education.delete()
+        skill.delete()
+        self.assertCounts(1, 0, 0)
+
+    def test_saving_an_existing_row_does_not_bump_counters(self):
+        skill = Skill.objects.create(job_seeker=self.seeker, name='Python', proficiency='beginner')
+        skill.proficiency = 'advanced'
+        skill.save()
+        self.assertCounts(0, 0, 1)
+
+
+# Caches on, so the recruiter/user/company invalidation receivers run too
+@override_settings(CURRENT_RECRUITER_CACHE_TIMEOUT=300, PUBLIC_RECRUITER_CACHE_TIMEOUT=300)
+class RegistrationRoleChangeTests(TestCase):
+    url = '/api/accounts/user/register/'
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.company = make_company()
+
+    def register(self, role, **extra):
+        data = {
+            'email': 'person@example.com',
+            'password': PASSWORD,
+            'first_name': 'Sita',
+            'last_name': 'Sharma',
+            'role': role,
+            'phone_number': '9800000000',
+            **extra,
+        }
+        return self.client.post(self.url, data, format='json')
+
+    def recruiter_fields(self):
+        return {'company': self.company.id, 'designation': 'Talent Lead'}
+
+    def test_job_seeker_becomes_recruiter(self):
+        self.assertEqual(self.register('job_seeker').status_code, 201)
+
+        response = self.register('recruiter', is_existing_user=True, **self.recruiter_fields())
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response.data['company'], 'Acme')
+        self.assertEqual(response.data['designation'], 'Talent Lead')
+        user = CustomUser.objects.get(email='person@example.com')
+        self.assertEqual(user.role, 'recruiter')
+        self.assertTrue(Recruiter.objects.filter(user=user, company=self.company).exists())
+        self.assertFalse(JobSeeker.objects.filter(user=user).exists())
+
+    def test_recruiter_becomes_job_seeker(self):
+        self.assertEqual(self.register('recruiter', **self.recruiter_fields()).status_code, 201)
+
+        response = self.register('job_seeker', is_existing_user=True, location='Pokhara')
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response.data['role'], 'job_seeker')
+        user = CustomUser.objects.get(email='person@example.com')
+        self.assertEqual(user.role, 'job_seeker')
+        self.assertTrue(JobSeeker.objects.filter(user=user, location='Pokhara').exists())
+        self.assertFalse(Recruiter.objects.filter(user=user).exists())
+
+    def test_role_change_requires_the_account_password(self):
+        self.register('job_seeker')
+
+        response = self.register(
+            'recruiter', is_existing_user=True, **{**self.recruiter_fields(), 'password': 'wrong-password'}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(CustomUser.objects.get(email='person@example.com').role, 'job_seeker')
+
+
+@override_settings(CURRENT_RECRUITER_CACHE_TIMEOUT=300)
+class CurrentRecruiterTests(TestCase):
+    """/recruiter/me/ is cached; saving the profile, user or company must show through"""
+    url = '/api/accounts/recruiter/me/'
+
+    def setUp(self):
+        cache.clear()
+        self.company = make_company()
+        self.user = CustomUser.objects.create_user(
+            'recruiter@example.com', PASSWORD, role='recruiter', first_name='Ram', last_name='Thapa'
+        )
+        self.recruiter = Recruiter.objects.create(
+            user=self.user, company=self.company, designation='Recruiter', phone_number='9800000000'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_reflects_profile_update(self):
+        self.assertEqual(self.client.get(self.url).data['designation'], 'Recruiter')
+
+        response = self.client.patch('/api/accounts/recruiter/profile/', {'designation': 'Head of Talent'}, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+
+        self.assertEqual(self.client.get(self.url).data['designation'], 'Head of Talent')
+
+    def test_reflects_user_and_company_saves(self):
+        self.client.get(self.url)
+
+        self.user.first_name = 'Hari'
+        self.user.save()
+        self.company.name = 'Acme Labs'
+        self.company.save()
+
+        data = self.client.get(self.url).data
+        self.assertEqual(data['first_name'], 'Hari')
+        self.assertEqual(data['company_details']['name'], 'Acme Labs')
+
+    @override_settings(CURRENT_RECRUITER_CACHE_TIMEOUT=0)
+    def test_uncached_by_default_without_shared_cache(self):
+        self.client.get(self.url)
+        Recruiter.objects.filter(pk=self.recruiter.pk).update(designation='Changed')
+
+        self.assertEqual(self.client.get(self.url).data['designation'], 'Changed')
+
+
+@override_settings(PUBLIC_RECRUITER_CACHE_TIMEOUT=300)
+class PublicRecruiterCacheTests(TestCase):
+    """Cached public profiles embed the company's recruiter count"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.old_company = make_company('Old Co')
+        self.new_company = make_company('New Co')
+        self.old_colleague = self.make_recruiter('old@example.com', self.old_company)
+        self.new_colleague = self.make_recruiter('new@example.com', self.new_company)
+        self.mover = self.make_recruiter('mover@example.com', self.old_company)
+
+    def make_recruiter(self, email, company):
+        user = CustomUser.objects.create_user(email, PASSWORD, role='recruiter')
+        return Recruiter.objects.create(user=user, company=company, designation='Recruiter', phone_number='9800000000')
+
+    def total_recruiters(self, recruiter):
+        response = self.client.get(f'/api/accounts/recruiters/{recruiter.pk}/public/')
+        return response.data['company_details']['total_recruiters']
+
+    def test_switching_company_refreshes_both_companies(self):
+        self.assertEqual(self.total_recruiters(self.old_colleague), 2)
+        self.assertEqual(self.total_recruiters(self.new_colleague), 1)
+
+        self.mover.company = self.new_company
+        self.mover.save()
+
+        self.assertEqual(self.total_recruiters(self.old_colleague), 1)
+        self.assertEqual(self.total_recruiters(self.new_colleague), 2)
@@ -3,11 +3,19 @@ import logging
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.exceptions import APIException, NotFound, ValidationError
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.views import TokenObtainPairView
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from .models import CustomUser, Recruiter, JobSeeker, Skill, Education, Experience
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from .models import (
+    CustomUser, Recruiter, JobSeeker, Skill, Education, Experience,
+    current_recruiter_cache_key, public_recruiter_cache_key,
+)
 from companies.models import Company
 from .serializers import (
     UserRegistrationSerializer, EmailTokenObtainPairSerializer, 
@@ -16,41 +24,60 @@ from .serializers import (
     SkillSerializer, RecruiterProfileSerializer, RecruiterUpdateSerializer, 
     CompanyUpdateSerializer
 )
-from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
+from .pagination import OptionalPageNumberPagination
+from .permissions import IsJobSeeker, IsRecruiter
 
 # Get logger for accounts app
 logger = logging.getLogger('accounts')
 
 User = get_user_model()
 
+
+def recruiter_profile_queryset():
+    """Recruiters with user/company joined and the company's recruiter count annotated"""
+    company_recruiters = (
+        Recruiter.objects.filter(company=OuterRef('company'))
+        .order_by()
+        .values('company')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Recruiter.objects.select_related('user', 'company').annotate(
+        company_total_recruiters=Coalesce(Subquery(company_recruiters, output_field=IntegerField()), 0)
+    )
+
+# Job seeker profile completion: basic info 20 + experience 30 + education 20
+# + skills 15 + documents 10 points
+JOB_SEEKER_DOCUMENT_FIELDS = ('resume', 'portfolio_url', 'github_url', 'linkedin_url')
+JOB_SEEKER_COMPLETION_TOTAL = 95
+
 class EmailTokenObtainPairView(TokenObtainPairView):
     serializer_class = EmailTokenObtainPairSerializer
     
     def post(self, request, *args, **kwargs):
-        logger.info(f"Login attempt for email: {request.data.get('email', 'unknown')}")
+        logger.info("Login attempt for email: %s", request.data.get('email', 'unknown'))
         try:
             response = super().post(request, *args, **kwargs)
-            if response.status_code == 200:
-                logger.info(f"Login successful for email: {request.data.get('email')}")
-            else:
-                logger.warning(f"Login failed for email: {request.data.get('email')}")
-            return response
-        except Exception as e:
-            logger.error(f"Login error: {str(e)}", exc_info=True)
+        except APIException:
+            # Bad credentials surface as AuthenticationFailed; DRF renders them
+            logger.warning("Login failed for email: %s", request.data.get('email'))
             raise
+        logger.info("Login successful for email: %s", request.data.get('email'))
+        return response
 
 class UserRegistrationView(generics.CreateAPIView):
     serializer_class = UserRegistrationSerializer
     permission_classes = [AllowAny]
     
     def create(self, request, *args, **kwargs):
-        logger.info(f"Registration attempt with email: {request.data.get('email', 'unknown')}")
+        logger.info("Registration attempt with email: %s", request.data.get('email', 'unknown'))
         
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
             try:
                 user = serializer.save()
-                logger.info(f"User registered successfully - ID: {user.id}, Email: {user.email}, Role: {user.role}")
+                logger.info("User registered successfully - ID: %s, Email: %s, Role: %s", user.id, user.email, user.role)
                 
                 response_data = {
                     'message': f'{user.role.replace("_", " ").title()} registered successfully',
@@ -68,24 +95,21 @@ class UserRegistrationView(generics.CreateAPIView):
                 return Response(response_data, status=status.HTTP_201_CREATED)
                 
             except Exception as e:
-                logger.error(f"Error during user registration: {str(e)}", exc_info=True)
+                logger.error("Error during user registration: %s", e, exc_info=True)
                 return Response({
                     'error': 'Registration failed due to internal error'
                 }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
         # Log validation errors
-        logger.warning(f"Registration validation failed for email {request.data.get('email')}: {serializer.errors}")
-        
-        # Return structured errors
-        errors = {}
-        for field, error_list in serializer.errors.items():
-            if isinstance(error_list, list):
-                errors[field] = error_list[0] if error_list else "Invalid value"
-            else:
-                errors[field] = str(error_list)
+        logger.warning("Registration validation failed for email %s: %s", request.data.get('email'), serializer.errors)
         
+        # Return structured errors – first message per field
         return Response({
-            'errors': errors
+            'errors': {
+                field: (error_list[0] if error_list else "Invalid value")
+                if isinstance(error_list, list) else str(error_list)
+                for field, error_list in serializer.errors.items()
+            }
         }, status=status.HTTP_400_BAD_REQUEST)
 
 class CurrentUserView(APIView):
@@ -94,7 +118,7 @@ class CurrentUserView(APIView):
     
     def get(self, request):
         user = request.user
-        logger.debug(f"Current user data accessed - User ID: {user.id}, Email: {user.email}")
+        logger.debug("Current user data accessed - User ID: %s, Email: %s", user.id, user.email)
         
         data = {
             'id': user.id,
@@ -111,16 +135,18 @@ class CheckEmailView(APIView):
 
     def post(self, request):
         email = request.data.get('email')
-        logger.info(f"Email check requested for: {email}")
+        logger.info("Email check requested for: %s", email)
         
         if not email:
             logger.warning("Email check attempted without email parameter")
             return Response({'error': 'Email is required'}, status=400)
         
         try:
-            if CustomUser.objects.filter(email=email).exists():
-                user = CustomUser.objects.get(email=email)
-                logger.info(f"Email exists: {email} (Role: {user.role})")
+            user = CustomUser.objects.filter(email=email).only(
+                'role', 'first_name', 'last_name'
+            ).first()
+            if user is not None:
+                logger.info("Email exists: %s (Role: %s)", email, user.role)
                 return Response({
                     'exists': True,
                     'role': user.role,
@@ -128,10 +154,10 @@ class CheckEmailView(APIView):
                     'last_name': user.last_name
                 })
             
-            logger.info(f"Email not found: {email}")
+            logger.info("Email not found: %s", email)
             return Response({'exists': False})
         except Exception as e:
-            logger.error(f"Error checking email {email}: {str(e)}", exc_info=True)
+            logger.error("Error checking email %s: %s", email, e, exc_info=True)
             return Response({'error': 'Error checking email'}, status=500)
 
 class CurrentRecruiterView(generics.RetrieveAPIView):
@@ -140,22 +166,32 @@ class CurrentRecruiterView(generics.RetrieveAPIView):
     URL: /api/accounts/recruiter/me/
     Method: GET
     """
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsRecruiter]
     serializer_class = CurrentRecruiterSerializer
     
     def get_object(self):
         user = self.request.user
-        logger.debug(f"Recruiter profile accessed - User ID: {user.id}")
-        
-        if user.role != 'recruiter':
-            logger.warning(f"Non-recruiter user {user.id} attempted to access recruiter profile")
-            raise PermissionDenied({"error": "User is not a recruiter"})
+        logger.debug("Recruiter profile accessed - User ID: %s", user.id)
         
         try:
-            return Recruiter.objects.get(user=user)
+            return Recruiter.objects.select_related('user', 'company').get(user=user)
         except Recruiter.DoesNotExist:
-            logger.error(f"Recruiter profile not found for user {user.id}")
+            logger.error("Recruiter profile not found for user %s", user.id)
             raise NotFound({"error": "Recruiter profile not found. Please complete your profile setup."})
+    
+    def retrieve(self, request, *args, **kwargs):
+        # Hit on most page loads; served from cache until the recruiter,
+        # their user or their company is saved (see accounts.signals)
+        timeout = settings.CURRENT_RECRUITER_CACHE_TIMEOUT
+        if not timeout:
+            return super().retrieve(request, *args, **kwargs)
+
+        cache_key = current_recruiter_cache_key(request.user.id)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.get_serializer(self.get_object()).data
+            cache.set(cache_key, data, timeout)
+        return Response(data)
 
 class JobSeekerProfileView(generics.RetrieveUpdateAPIView):
     """
@@ -163,8 +199,8 @@ class JobSeekerProfileView(generics.RetrieveUpdateAPIView):
     URL: /api/accounts/job-seeker/profile/
     Methods: GET, PATCH
     """
-    permission_classes = [IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser]
+    permission_classes = [IsJobSeeker]
+    parser_classes = [JSONParser, MultiPartParser, FormParser]
     
     def get_serializer_class(self):
         if self.request.method == 'GET':
@@ -173,16 +209,18 @@ class JobSeekerProfileView(generics.RetrieveUpdateAPIView):
     
     def get_object(self):
         user = self.request.user
-        logger.debug(f"Job seeker profile accessed - User ID: {user.id}")
+        logger.debug("Job seeker profile accessed - User ID: %s", user.id)
         
-        if user.role != 'job_seeker':
-            logger.warning(f"Non-job-seeker user {user.id} attempted to access job seeker profile")
-            raise PermissionDenied({"error": "User is not a job seeker"})
+        queryset = JobSeeker.objects.select_related('user')
+        if self.request.method == 'GET':
+            # Nested serializer fields + completion checks read these; each is
+            # fetched once here and served from the prefetch cache afterwards
+            queryset = queryset.prefetch_related('experiences', 'educations', 'skills')
         
         try:
-            return JobSeeker.objects.get(user=user)
+            return queryset.get(user=user)
         except JobSeeker.DoesNotExist:
-            logger.error(f"Job seeker profile not found for user {user.id}")
+            logger.error("Job seeker profile not found for user %s", user.id)
             raise NotFound({"error": "Job seeker profile not found"})
     
     def retrieve(self, request, *args, **kwargs):
@@ -194,116 +232,100 @@ class JobSeekerProfileView(generics.RetrieveUpdateAPIView):
         response_data = serializer.data
         response_data['profile_completion'] = completion_data
         
-        logger.info(f"Job seeker profile retrieved - User ID: {request.user.id}, Completion: {completion_data['percentage']}%")
+        logger.debug("Job seeker profile retrieved - User ID: %s, Completion: %s%%", request.user.id, completion_data['percentage'])
         return Response(response_data)
     
     def update(self, request, *args, **kwargs):
-        logger.info(f"Job seeker profile update attempt - User ID: {request.user.id}")
-        try:
-            response = super().update(request, *args, **kwargs)
-            logger.info(f"Job seeker profile updated successfully - User ID: {request.user.id}")
-            return response
-        except Exception as e:
-            logger.error(f"Job seeker profile update failed - User ID: {request.user.id}, Error: {str(e)}", exc_info=True)
-            raise
+        logger.info("Job seeker profile update attempt - User ID: %s", request.user.id)
+        response = super().update(request, *args, **kwargs)
+        logger.info("Job seeker profile updated successfully - User ID: %s", request.user.id)
+        return response
     
     def calculate_profile_completion(self, job_seeker):
         """Calculate profile completion percentage"""
-        sections = {
-            'basic_info': ['title', 'location', 'phone_number', 'bio'],
-            'professional': ['experiences'],
-            'education': ['educations'],
-            'skills': ['skills'],
-            'documents': ['resume', 'portfolio_url', 'github_url', 'linkedin_url']
-        }
-        
-        total_points = 0
         earned_points = 0
+        # Each predicate is evaluated once and shared by the score and checklist
+        bio = job_seeker.bio
+        has_bio = bool(bio and len(bio) > 50)
+        has_title = bool(job_seeker.title)
+        has_location = bool(job_seeker.location)
+        has_phone = bool(job_seeker.phone_number)
+        # Counter caches kept in sync by accounts.signals – no COUNT queries
+        experiences_count = job_seeker.experiences_count
+        educations_count = job_seeker.educations_count
+        skills_count = job_seeker.skills_count
         
         # Basic Info (25% weight)
-        for field in sections['basic_info']:
-            total_points += 5
-            if field == 'bio':
-                if getattr(job_seeker, field) and len(getattr(job_seeker, field)) > 50:
-                    earned_points += 5
-            elif getattr(job_seeker, field):
-                earned_points += 5
+        earned_points += 5 * (has_bio + has_title + has_location + has_phone)
         
         # Professional Experience (30% weight)
-        total_points += 30
-        if job_seeker.experiences.exists():
+        if experiences_count:
             earned_points += 30
         
         # Education (20% weight)
-        total_points += 20
-        if job_seeker.educations.exists():
+        if educations_count:
             earned_points += 20
         
         # Skills (15% weight)
-        total_points += 15
-        if job_seeker.skills.count() >= 3:
+        if skills_count >= 3:
             earned_points += 15
-        elif job_seeker.skills.exists():
+        elif skills_count:
             earned_points += 10
         
         # Documents/Links (10% weight)
-        doc_points = 0
-        for field in sections['documents']:
-            if getattr(job_seeker, field):
-                doc_points += 2.5
-        total_points += 10
+        doc_points = 2.5 * sum(1 for field in JOB_SEEKER_DOCUMENT_FIELDS if getattr(job_seeker, field))
         earned_points += min(doc_points, 10)
         
-        percentage = (earned_points / total_points) * 100 if total_points > 0 else 0
+        percentage = (earned_points / JOB_SEEKER_COMPLETION_TOTAL) * 100
         
         # Get checklist
         checklist = [
             {
                 'id': 1,
                 'label': 'Complete your bio',
-                'completed': bool(job_seeker.bio and len(job_seeker.bio) > 50),
+                'completed': has_bio,
                 'weight': 5,
                 'field': 'bio'
             },
             {
                 'id': 2,
                 'label': 'Add your professional title',
-                'completed': bool(job_seeker.title),
+                'completed': has_title,
                 'weight': 5,
                 'field': 'title'
             },
             {
                 'id': 3,
                 'label': 'Add location',
-                'completed': bool(job_seeker.location),
+                'completed': has_location,
                 'weight': 5,
                 'field': 'location'
             },
             {
                 'id': 4,
                 'label': 'Add phone number',
-                'completed': bool(job_seeker.phone_number),
+                'completed': has_phone,
                 'weight': 5,
                 'field': 'phone_number'
             },
             {
                 'id': 5,
                 'label': 'Add at least one work experience',
-                'completed': job_seeker.experiences.exists(),
+                'completed': experiences_count > 0,
                 'weight': 30,
                 'field': 'experiences'
             },
             {
                 'id': 6,
                 'label': 'Add education',
-                'completed': job_seeker.educations.exists(),
+                'completed': educations_count > 0,
                 'weight': 20,
                 'field': 'educations'
             },
             {
                 'id': 7,
                 'label': 'Add at least 3 skills',
-                'completed': job_seeker.skills.count() >= 3,
+                'completed': skills_count >= 3,
                 'weight': 15,
                 'field': 'skills'
             },
@@ -331,227 +353,154 @@ class JobSeekerProfileView(generics.RetrieveUpdateAPIView):
 # Experience Views
 class ExperienceListCreateView(generics.ListCreateAPIView):
     """List and create experiences for job seeker"""
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsJobSeeker]
     serializer_class = ExperienceSerializer
+    pagination_class = OptionalPageNumberPagination
     
     def get_queryset(self):
         user = self.request.user
-        logger.debug(f"Experience list accessed - User ID: {user.id}")
+        logger.debug("Experience list accessed - User ID: %s", user.id)
         
-        if user.role != 'job_seeker':
-            logger.warning(f"Non-job-seeker user {user.id} attempted to access experiences")
-            raise PermissionDenied({"error": "User is not a job seeker"})
-        
-        try:
-            job_seeker = JobSeeker.objects.get(user=user)
-            return Experience.objects.filter(job_seeker=job_seeker)
-        except JobSeeker.DoesNotExist:
-            logger.error(f"Job seeker profile not found for user {user.id}")
-            raise NotFound({"error": "Job seeker profile not found"})
+        # Join through the profile instead of fetching it first
+        return Experience.objects.filter(job_seeker__user=user)
     
     def perform_create(self, serializer):
         user = self.request.user
-        logger.info(f"Experience creation attempt - User ID: {user.id}")
+        logger.info("Experience creation attempt - User ID: %s", user.id)
         
         try:
-            job_seeker = JobSeeker.objects.get(user=user)
+            job_seeker = JobSeeker.objects.only('id').get(user=user)
             serializer.save(job_seeker=job_seeker)
-            logger.info(f"Experience created successfully - User ID: {user.id}")
+            logger.info("Experience created successfully - User ID: %s", user.id)
         except JobSeeker.DoesNotExist:
-            logger.error(f"Job seeker profile not found for user {user.id}")
+            logger.error("Job seeker profile not found for user %s", user.id)
             raise NotFound({"error": "Job seeker profile not found"})
-        except Exception as e:
-            logger.error(f"Experience creation failed - User ID: {user.id}, Error: {str(e)}", exc_info=True)
-            raise
 
 class ExperienceDetailView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, and delete an experience"""
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsJobSeeker]
     serializer_class = ExperienceSerializer
     
     def get_queryset(self):
         user = self.request.user
-        if user.role != 'job_seeker':
-            raise PermissionDenied({"error": "User is not a job seeker"})
-        
-        try:
-            job_seeker = JobSeeker.objects.get(user=user)
-            return Experience.objects.filter(job_seeker=job_seeker)
-        except JobSeeker.DoesNotExist:
-            raise NotFound({"error": "Job seeker profile not found"})
+        # Join through the profile instead of fetching it first
+        return Experience.objects.filter(job_seeker__user=user)
     
     def perform_update(self, serializer):
         user = self.request.user
-        logger.info(f"Experience update attempt - User ID: {user.id}, Experience ID: {self.kwargs.get('pk')}")
-        try:
-            serializer.save()
-            logger.info(f"Experience updated successfully - User ID: {user.id}")
-        except Exception as e:
-            logger.error(f"Experience update failed - User ID: {user.id}, Error: {str(e)}", exc_info=True)
-            raise
+        logger.info("Experience update attempt - User ID: %s, Experience ID: %s", user.id, self.kwargs.get('pk'))
+        serializer.save()
+        logger.info("Experience updated successfully - User ID: %s", user.id)
     
     def perform_destroy(self, instance):
         user = self.request.user
-        logger.info(f"Experience deletion attempt - User ID: {user.id}, Experience ID: {instance.id}")
-        try:
-            instance.delete()
-            logger.info(f"Experience deleted successfully - User ID: {user.id}")
-        except Exception as e:
-            logger.error(f"Experience deletion failed - User ID: {user.id}, Error: {str(e)}", exc_info=True)
-            raise
+        logger.info("Experience deletion attempt - User ID: %s, Experience ID: %s", user.id, instance.id)
+        instance.delete()
+        logger.info("Experience deleted successfully - User ID: %s", user.id)
 
 # Education Views
 class EducationListCreateView(generics.ListCreateAPIView):
     """List and create educations for job seeker"""
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsJobSeeker]
     serializer_class = EducationSerializer
+    pagination_class = OptionalPageNumberPagination
     
     def get_queryset(self):
         user = self.request.user
-        logger.debug(f"Education list accessed - User ID: {user.id}")
-        
-        if user.role != 'job_seeker':
-            logger.warning(f"Non-job-seeker user {user.id} attempted to access education")
-            raise PermissionDenied({"error": "User is not a job seeker"})
+        logger.debug("Education list accessed - User ID: %s", user.id)
         
-        try:
-            job_seeker = JobSeeker.objects.get(user=user)
-            return Education.objects.filter(job_seeker=job_seeker)
-        except JobSeeker.DoesNotExist:
-            logger.error(f"Job seeker profile not found for user {user.id}")
-            raise NotFound({"error": "Job seeker profile not found"})
+        # Join through the profile instead of fetching it first
+        return Education.objects.filter(job_seeker__user=user)
     
     def perform_create(self, serializer):
         user = self.request.user
-        logger.info(f"Education creation attempt - User ID: {user.id}")
+        logger.info("Education creation attempt - User ID: %s", user.id)
         
         try:
-            job_seeker = JobSeeker.objects.get(user=user)
+            job_seeker = JobSeeker.objects.only('id').get(user=user)
             serializer.save(job_seeker=job_seeker)
-            logger.info(f"Education created successfully - User ID: {user.id}")
+            logger.info("Education created successfully - User ID: %s", user.id)
         except JobSeeker.DoesNotExist:
-            logger.error(f"Job seeker profile not found for user {user.id}")
+            logger.error("Job seeker profile not found for user %s", user.id)
             raise NotFound({"error": "Job seeker profile not found"})
-        except Exception as e:
-            logger.error(f"Education creation failed - User ID: {user.id}, Error: {str(e)}", exc_info=True)
-            raise
 
 class EducationDetailView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, and delete an education"""
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsJobSeeker]
     serializer_class = EducationSerializer
     
     def get_queryset(self):
         user = self.request.user
-        if user.role != 'job_seeker':
-            raise PermissionDenied({"error": "User is not a job seeker"})
-        
-        try:
-            job_seeker = JobSeeker.objects.get(user=user)
-            return Education.objects.filter(job_seeker=job_seeker)
-        except JobSeeker.DoesNotExist:
-            raise NotFound({"error": "Job seeker profile not found"})
+        # Join through the profile instead of fetching it first
+        return Education.objects.filter(job_seeker__user=user)
     
     def perform_update(self, serializer):
         user = self.request.user
-        logger.info(f"Education update attempt - User ID: {user.id}, Education ID: {self.kwargs.get('pk')}")
-        try:
-            serializer.save()
-            logger.info(f"Education updated successfully - User ID: {user.id}")
-        except Exception as e:
-            logger.error(f"Education update failed - User ID: {user.id}, Error: {str(e)}", exc_info=True)
-            raise
+        logger.info("Education update attempt - User ID: %s, Education ID: %s", user.id, self.kwargs.get('pk'))
+        serializer.save()
+        logger.info("Education updated successfully - User ID: %s", user.id)
     
     def perform_destroy(self, instance):
         user = self.request.user
-        logger.info(f"Education deletion attempt - User ID: {user.id}, Education ID: {instance.id}")
-        try:
-            instance.delete()
-            logger.info(f"Education deleted successfully - User ID: {user.id}")
-        except Exception as e:
-            logger.error(f"Education deletion failed - User ID: {user.id}, Error: {str(e)}", exc_info=True)
-            raise
+        logger.info("Education deletion attempt - User ID: %s, Education ID: %s", user.id, instance.id)
+        instance.delete()
+        logger.info("Education deleted successfully - User ID: %s", user.id)
 
 # Skills Views
 class SkillListCreateView(generics.ListCreateAPIView):
     """List and create skills for job seeker"""
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsJobSeeker]
     serializer_class = SkillSerializer
+    pagination_class = OptionalPageNumberPagination
     
     def get_queryset(self):
         user = self.request.user
-        logger.debug(f"Skill list accessed - User ID: {user.id}")
+        logger.debug("Skill list accessed - User ID: %s", user.id)
         
-        if user.role != 'job_seeker':
-            logger.warning(f"Non-job-seeker user {user.id} attempted to access skills")
-            raise PermissionDenied({"error": "User is not a job seeker"})
-        
-        try:
-            job_seeker = JobSeeker.objects.get(user=user)
-            return Skill.objects.filter(job_seeker=job_seeker)
-        except JobSeeker.DoesNotExist:
-            logger.error(f"Job seeker profile not found for user {user.id}")
-            raise NotFound({"error": "Job seeker profile not found"})
+        # Join through the profile instead of fetching it first
+        return Skill.objects.filter(job_seeker__user=user).order_by('id')  # stable pages
     
     def perform_create(self, serializer):
         user = self.request.user
-        logger.info(f"Skill creation attempt - User ID: {user.id}")
+        logger.info("Skill creation attempt - User ID: %s", user.id)
         
         try:
-            job_seeker = JobSeeker.objects.get(user=user)
+            job_seeker = JobSeeker.objects.only('id').get(user=user)
             
-            # Check if skill already exists for this job seeker
+            # Duplicates are rejected by the (job_seeker, name) unique constraint
             skill_name = serializer.validated_data.get('name')
-            if Skill.objects.filter(job_seeker=job_seeker, name=skill_name).exists():
-                logger.warning(f"Duplicate skill attempt - User ID: {user.id}, Skill: {skill_name}")
+            try:
+                with transaction.atomic():
+                    serializer.save(job_seeker=job_seeker)
+            except IntegrityError:
+                logger.warning("Duplicate skill attempt - User ID: %s, Skill: %s", user.id, skill_name)
                 raise ValidationError({"error": f"Skill '{skill_name}' already exists"})
-            
-            serializer.save(job_seeker=job_seeker)
-            logger.info(f"Skill created successfully - User ID: {user.id}, Skill: {skill_name}")
+            logger.info("Skill created successfully - User ID: %s, Skill: %s", user.id, skill_name)
         except JobSeeker.DoesNotExist:
-            logger.error(f"Job seeker profile not found for user {user.id}")
+            logger.error("Job seeker profile not found for user %s", user.id)
             raise NotFound({"error": "Job seeker profile not found"})
-        except ValidationError:
-            raise
-        except Exception as e:
-            logger.error(f"Skill creation failed - User ID: {user.id}, Error: {str(e)}", exc_info=True)
-            raise
 
 class SkillDetailView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, and delete a skill"""
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsJobSeeker]
     serializer_class = SkillSerializer
     
     def get_queryset(self):
         user = self.request.user
-        if user.role != 'job_seeker':
-            raise PermissionDenied({"error": "User is not a job seeker"})
-        
-        try:
-            job_seeker = JobSeeker.objects.get(user=user)
-            return Skill.objects.filter(job_seeker=job_seeker)
-        except JobSeeker.DoesNotExist:
-            raise NotFound({"error": "Job seeker profile not found"})
+        # Join through the profile instead of fetching it first
+        return Skill.objects.filter(job_seeker__user=user)
     
     def perform_update(self, serializer):
         user = self.request.user
-        logger.info(f"Skill update attempt - User ID: {user.id}, Skill ID: {self.kwargs.get('pk')}")
-        try:
-            serializer.save()
-            logger.info(f"Skill updated successfully - User ID: {user.id}")
-        except Exception as e:
-            logger.error(f"Skill update failed - User ID: {user.id}, Error: {str(e)}", exc_info=True)
-            raise
+        logger.info("Skill update attempt - User ID: %s, Skill ID: %s", user.id, self.kwargs.get('pk'))
+        serializer.save()
+        logger.info("Skill updated successfully - User ID: %s", user.id)
     
     def perform_destroy(self, instance):
         user = self.request.user
-        logger.info(f"Skill deletion attempt - User ID: {user.id}, Skill: {instance.name}")
-        try:
-            instance.delete()
-            logger.info(f"Skill deleted successfully - User ID: {user.id}")
-        except Exception as e:
-            logger.error(f"Skill deletion failed - User ID: {user.id}, Error: {str(e)}", exc_info=True)
-            raise
+        logger.info("Skill deletion attempt - User ID: %s, Skill: %s", user.id, instance.name)
+        instance.delete()
+        logger.info("Skill deleted successfully - User ID: %s", user.id)
 
 class RecruiterProfileView(generics.RetrieveUpdateAPIView):
     """
@@ -559,8 +508,8 @@ class RecruiterProfileView(generics.RetrieveUpdateAPIView):
     URL: /api/accounts/recruiter/profile/
     Methods: GET, PATCH
     """
-    permission_classes = [IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser]
+    permission_classes = [IsRecruiter]
+    parser_classes = [JSONParser, MultiPartParser, FormParser]
     
     def get_serializer_class(self):
         if self.request.method == 'GET':
@@ -569,33 +518,25 @@ class RecruiterProfileView(generics.RetrieveUpdateAPIView):
     
     def get_object(self):
         user = self.request.user
-        logger.debug(f"Recruiter profile accessed - User ID: {user.id}")
-        
-        if user.role != 'recruiter':
-            logger.warning(f"Non-recruiter user {user.id} attempted to access recruiter profile")
-            raise PermissionDenied({"error": "User is not a recruiter"})
+        logger.debug("Recruiter profile accessed - User ID: %s", user.id)
         
         try:
-            return Recruiter.objects.get(user=user)
+            return recruiter_profile_queryset().get(user=user)
         except Recruiter.DoesNotExist:
-            logger.error(f"Recruiter profile not found for user {user.id}")
+            logger.error("Recruiter profile not found for user %s", user.id)
             raise NotFound({"error": "Recruiter profile not found"})
     
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
-        logger.info(f"Recruiter profile retrieved - User ID: {request.user.id}")
+        logger.debug("Recruiter profile retrieved - User ID: %s", request.user.id)
         return Response(serializer.data)
     
     def update(self, request, *args, **kwargs):
-        logger.info(f"Recruiter profile update attempt - User ID: {request.user.id}")
-        try:
-            response = super().update(request, *args, **kwargs)
-            logger.info(f"Recruiter profile updated successfully - User ID: {request.user.id}")
-            return response
-        except Exception as e:
-            logger.error(f"Recruiter profile update failed - User ID: {request.user.id}, Error: {str(e)}", exc_info=True)
-            raise
+        logger.info("Recruiter profile update attempt - User ID: %s", request.user.id)
+        response = super().update(request, *args, **kwargs)
+        logger.info("Recruiter profile updated successfully - User ID: %s", request.user.id)
+        return response
 
 class CompanyProfileView(generics.RetrieveUpdateAPIView):
     """
@@ -603,43 +544,35 @@ class CompanyProfileView(generics.RetrieveUpdateAPIView):
     URL: /api/accounts/recruiter/company/
     Methods: GET, PATCH
     """
-    permission_classes = [IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser]
+    permission_classes = [IsRecruiter]
+    parser_classes = [JSONParser, MultiPartParser, FormParser]
     serializer_class = CompanyUpdateSerializer
     
     def get_object(self):
         user = self.request.user
-        logger.debug(f"Company profile accessed - User ID: {user.id}")
-        
-        if user.role != 'recruiter':
-            logger.warning(f"Non-recruiter user {user.id} attempted to access company profile")
-            raise PermissionDenied({"error": "User is not a recruiter"})
+        logger.debug("Company profile accessed - User ID: %s", user.id)
         
         try:
-            recruiter = Recruiter.objects.get(user=user)
+            recruiter = Recruiter.objects.select_related('company').get(user=user)
             if not recruiter.company:
-                logger.warning(f"Recruiter {user.id} has no company assigned")
+                logger.warning("Recruiter %s has no company assigned", user.id)
                 raise NotFound({"error": "No company assigned to this recruiter"})
             return recruiter.company
         except Recruiter.DoesNotExist:
-            logger.error(f"Recruiter profile not found for user {user.id}")
+            logger.error("Recruiter profile not found for user %s", user.id)
             raise NotFound({"error": "Recruiter profile not found"})
     
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
-        logger.info(f"Company profile retrieved - User ID: {request.user.id}, Company: {instance.name}")
+        logger.debug("Company profile retrieved - User ID: %s, Company: %s", request.user.id, instance.name)
         return Response(serializer.data)
     
     def update(self, request, *args, **kwargs):
-        logger.info(f"Company profile update attempt - User ID: {request.user.id}")
-        try:
-            response = super().update(request, *args, **kwargs)
-            logger.info(f"Company profile updated successfully - User ID: {request.user.id}")
-            return response
-        except Exception as e:
-            logger.error(f"Company profile update failed - User ID: {request.user.id}, Error: {str(e)}", exc_info=True)
-            raise
+        logger.info("Company profile update attempt - User ID: %s", request.user.id)
+        response = super().update(request, *args, **kwargs)
+        logger.info("Company profile updated successfully - User ID: %s", request.user.id)
+        return response
 
 class PublicRecruiterProfileView(generics.RetrieveAPIView):
     """
@@ -651,12 +584,24 @@ class PublicRecruiterProfileView(generics.RetrieveAPIView):
     
     def get_object(self):
         recruiter_id = self.kwargs.get('pk')
-        logger.info(f"Public recruiter profile accessed - Recruiter ID: {recruiter_id}")
+        logger.debug("Public recruiter profile accessed - Recruiter ID: %s", recruiter_id)
         
         try:
-            recruiter = Recruiter.objects.get(id=recruiter_id, user__is_active=True)
-            logger.debug(f"Public recruiter profile found - Recruiter ID: {recruiter_id}")
+            recruiter = recruiter_profile_queryset().get(id=recruiter_id, user__is_active=True)
+            logger.debug("Public recruiter profile found - Recruiter ID: %s", recruiter_id)
             return recruiter
         except Recruiter.DoesNotExist:
-            logger.warning(f"Public recruiter profile not found - Recruiter ID: {recruiter_id}")
-            raise NotFound({"error": "Recruiter not found"})
\ No newline at end of file
+            logger.warning("Public recruiter profile not found - Recruiter ID: %s", recruiter_id)
+            raise NotFound({"error": "Recruiter not found"})
+    
+    def retrieve(self, request, *args, **kwargs):
+        timeout = settings.PUBLIC_RECRUITER_CACHE_TIMEOUT
+        if not timeout:
+            return super().retrieve(request, *args, **kwargs)
+        
+        cache_key = public_recruiter_cache_key(self.kwargs.get('pk'))
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.get_serializer(self.get_object()).data
+            cache.set(cache_key, data, timeout)
+        return Response(data)
\ No newline at end of file
@@ -1,52 +1,148 @@
-from django.db.models import Count, Avg, Sum, Q, F
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Avg, Sum, Q, F, DurationField, ExpressionWrapper
+from django.db.models.functions import TruncDate, TruncMonth
 from django.utils import timezone
-from datetime import timedelta, datetime
+from datetime import timedelta
 from accounts.models import Recruiter, CustomUser
 from applications.models import Application, Interview
 from jobs.models import Job
 from chat.models import Conversation, Message
-import calendar
+from collections import Counter, defaultdict
+import heapq
+from operator import itemgetter
+
+# Application statuses that count as a hire
+HIRED_STATUSES = ('accepted', 'hired')
+
+# Time ranges whose analytics overview is cached
+TIME_RANGES = ('week', 'month', 'quarter', 'year')
+
+
+def dashboard_stats_cache_key(recruiter_id):
+    return f"dash:stats:{recruiter_id}"
+
+
+def analytics_overview_cache_key(recruiter_id, time_range):
+    return f"analytics:{recruiter_id}:{time_range}"
+
+
+def invalidate_recruiter_dashboards(recruiter_ids):
+    """Drop the cached dashboard stats and analytics overviews of the given recruiters"""
+    if not settings.DASHBOARD_CACHE_TIMEOUT:
+        return
+    keys = []
+    for recruiter_id in recruiter_ids:
+        keys.append(dashboard_stats_cache_key(recruiter_id))
+        keys += [analytics_overview_cache_key(recruiter_id, time_range) for time_range in TIME_RANGES]
+    if keys:
+        cache.delete_many(keys)
+
+
+def invalidate_recruiter_dashboard(recruiter_id):
+    invalidate_recruiter_dashboards([recruiter_id])
+
+
+def _cached(key, compute):
+    """Serve compute() through the cache for DASHBOARD_CACHE_TIMEOUT seconds (0 disables)"""
+    if not settings.DASHBOARD_CACHE_TIMEOUT:
+        return compute()
+    return cache.get_or_set(key, compute, settings.DASHBOARD_CACHE_TIMEOUT)
+
 
 class RecruiterDashboardService:
     """Service to fetch and calculate dashboard data"""
     
     def __init__(self, recruiter):
         self.recruiter = recruiter
-        self.user = recruiter.user
+        # One clock reading per service instance, shared by every helper
+        self.now = timezone.now()
+        self.last_month = self.now - timedelta(days=30)
+        self.today_start = timezone.localtime(self.now).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.tomorrow_start = self.today_start + timedelta(days=1)
         
     def get_dashboard_stats(self):
         """Get all stats for recruiter dashboard"""
+        return _cached(dashboard_stats_cache_key(self.recruiter.id), self._compute_dashboard_stats)
+    
+    def get_quick_stats(self):
+        """Get the four quick stats tiles (shares the cached dashboard stats)"""
+        stats = self.get_dashboard_stats()
+        
+        return [
+            {
+                'title': 'Total Applications',
+                'value': stats['total_applications']['value'],
+                'change': stats['total_applications']['change'],
+                'trend': stats['total_applications']['trend']
+            },
+            {
+                'title': 'Active Jobs',
+                'value': stats['active_jobs']['value'],
+                'change': stats['active_jobs']['change'],
+                'trend': stats['active_jobs']['trend']
+            },
+            {
+                'title': 'Interviews Today',
+                'value': stats['interviews_today'],
+                'change': 'Today',
+                'trend': 'neutral'
+            },
+            {
+                'title': 'Unread Messages',
+                'value': stats['unread_messages']['value'],
+                'change': stats['unread_messages']['change'],
+                'trend': stats['unread_messages']['trend']
+            }
+        ]
+    
+    def _compute_dashboard_stats(self):
         # Get all jobs posted by this recruiter
         recruiter_jobs = Job.objects.filter(recruiter=self.recruiter)
         
         # Get all applications for recruiter's jobs
         applications = Application.objects.filter(job__recruiter=self.recruiter)
         
+        # One conditional-aggregate query per table instead of a COUNT per stat
+        job_counts = recruiter_jobs.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True, is_published=True)),
+        )
+        application_counts = applications.aggregate(
+            total=Count('id'),
+            last_month=Count('id', filter=Q(applied_at__lt=self.last_month)),
+            today=Count('id', filter=Q(applied_at__gte=self.today_start, applied_at__lt=self.tomorrow_start)),
+            hired=Count('id', filter=Q(status__in=HIRED_STATUSES)),
+            hired_last_month=Count('id', filter=Q(status__in=HIRED_STATUSES, hired_date__lt=self.last_month)),
+        )
+        interview_counts = Interview.objects.filter(
+            application__job__recruiter=self.recruiter,
+            status='scheduled'
+        ).aggregate(
+            scheduled=Count('id'),
+            last_month=Count('id', filter=Q(scheduled_date__gte=self.last_month)),
+            today=Count('id', filter=Q(scheduled_date__gte=self.today_start, scheduled_date__lt=self.tomorrow_start)),
+        )
+        
         # Calculate stats
         stats = {
-            'total_applications': self._get_total_applications(applications),
-            'active_jobs': self._get_active_jobs(recruiter_jobs),
-            'interview_scheduled': self._get_interviews_scheduled(),
+            'total_applications': self._get_total_applications(application_counts),
+            'active_jobs': self._get_active_jobs(job_counts),
+            'interview_scheduled': self._get_interviews_scheduled(interview_counts),
             'avg_time_to_hire': self._get_avg_time_to_hire(applications),
             'unread_messages': self._get_unread_messages(),
-            'applications_today': self._get_applications_today(applications),
-            'interviews_today': self._get_interviews_today(),
-            'hired_candidates': self._get_hired_candidates(applications),  # Add this
+            'applications_today': application_counts['today'],
+            'interviews_today': interview_counts['today'],
+            'hired_candidates': self._get_hired_candidates(application_counts),  # Add this
         }
         
         return stats
     
-    def _get_total_applications(self, applications):
+    def _get_total_applications(self, counts):
         """Get total applications with change from last month"""
-        total = applications.count()
-        
-        # Calculate change from last month
-        last_month = timezone.now() - timedelta(days=30)
-        last_month_count = applications.filter(
-            applied_at__lt=last_month
-        ).count()
-        
-        change = self._calculate_percentage_change(last_month_count, total)
+        total = counts['total']
+        change = self._calculate_percentage_change(counts['last_month'], total)
         
         return {
             'value': total,
@@ -54,10 +150,10 @@ class RecruiterDashboardService:
             'trend': 'up' if change > 0 else 'down'
         }
     
-    def _get_active_jobs(self, jobs):
+    def _get_active_jobs(self, counts):
         """Get active jobs count"""
-        active = jobs.filter(is_active=True, is_published=True).count()
-        total = jobs.count()
+        active = counts['active']
+        total = counts['total']
         
         return {
             'value': active,
@@ -65,22 +161,10 @@ class RecruiterDashboardService:
             'trend': 'up' if active > 0 else 'down'
         }
     
-    def _get_interviews_scheduled(self):
+    def _get_interviews_scheduled(self, counts):
         """Get scheduled interviews count"""
-        interviews = Interview.objects.filter(
-            application__job__recruiter=self.recruiter,
-            status='scheduled'
-        ).count()
-        
-        # Get interviews from last month for comparison
-        last_month = timezone.now() - timedelta(days=30)
-        last_month_interviews = Interview.objects.filter(
-            application__job__recruiter=self.recruiter,
-            status='scheduled',
-            scheduled_date__gte=last_month
-        ).count()
-        
-        change = self._calculate_percentage_change(last_month_interviews, interviews)
+        interviews = counts['scheduled']
+        change = self._calculate_percentage_change(counts['last_month'], interviews)
         
         return {
             'value': interviews,
@@ -90,44 +174,27 @@ class RecruiterDashboardService:
     
     def _get_avg_time_to_hire(self, applications):
         """Calculate average time from application to offer/hire"""
-        # Include both accepted and hired applications
-        hired_applications = applications.filter(
-            status__in=['accepted', 'hired'],
+        # Include both accepted and hired applications; the DB averages the durations
+        time_to_hire = ExpressionWrapper(F('offer_date') - F('applied_at'), output_field=DurationField())
+        averages = applications.filter(
+            status__in=HIRED_STATUSES,
             offer_date__isnull=False
+        ).aggregate(
+            current=Avg(time_to_hire),
+            previous=Avg(time_to_hire, filter=Q(offer_date__lt=self.last_month)),
         )
         
-        if hired_applications.exists():
-            total_days = 0
-            for app in hired_applications:
-                if app.offer_date and app.applied_at:
-                    days = (app.offer_date - app.applied_at).days
-                    total_days += days
-            
-            avg_days = total_days / hired_applications.count()
-            
-            # Compare with previous period
-            last_month = timezone.now() - timedelta(days=30)
-            previous_hires = applications.filter(
-                status__in=['accepted', 'hired'],
-                offer_date__isnull=False,
-                offer_date__lt=last_month
-            )
+        # Compare with previous period
+        if averages['current'] is not None and averages['previous'] is not None:
+            avg_days = averages['current'].total_seconds() / 86400
+            prev_avg_days = averages['previous'].total_seconds() / 86400
+            change_days = prev_avg_days - avg_days
             
-            if previous_hires.exists():
-                prev_total_days = 0
-                for app in previous_hires:
-                    if app.offer_date and app.applied_at:
-                        days = (app.offer_date - app.applied_at).days
-                        prev_total_days += days
-                
-                prev_avg_days = prev_total_days / previous_hires.count()
-                change_days = prev_avg_days - avg_days
-                
-                return {
-                    'value': f"{avg_days:.1f} days",
-                    'change': f"-{abs(change_days):.1f} days" if change_days > 0 else f"+{abs(change_days):.1f} days",
-                    'trend': 'up' if change_days > 0 else 'down'
-                }
+            return {
+                'value': f"{avg_days:.1f} days",
+                'change': f"-{abs(change_days):.1f} days" if change_days > 0 else f"+{abs(change_days):.1f} days",
+                'trend': 'up' if change_days > 0 else 'down'
+            }
         
         return {
             'value': 'N/A',
@@ -137,8 +204,9 @@ class RecruiterDashboardService:
     
     def _get_unread_messages(self):
         """Get unread messages count"""
-        conversations = Conversation.objects.filter(recruiter=self.recruiter)
-        unread = sum(conv.unread_by_recruiter for conv in conversations)
+        unread = Conversation.objects.filter(
+            recruiter=self.recruiter
+        ).aggregate(total=Sum('unread_by_recruiter'))['total'] or 0
         
         return {
             'value': unread,
@@ -146,28 +214,6 @@ class RecruiterDashboardService:
             'trend': 'up' if unread > 0 else 'down'
         }
     
-    def _get_applications_today(self, applications):
-        """Get applications received today"""
-        today = timezone.now().date()
-        today_start = timezone.make_aware(datetime.combine(today, datetime.min.time()))
-        today_end = timezone.make_aware(datetime.combine(today, datetime.max.time()))
-        
-        return applications.filter(
-            applied_at__range=[today_start, today_end]
-        ).count()
-    
-    def _get_interviews_today(self):
-        """Get interviews scheduled for today"""
-        today = timezone.now().date()
-        today_start = timezone.make_aware(datetime.combine(today, datetime.min.time()))
-        today_end = timezone.make_aware(datetime.combine(today, datetime.max.time()))
-        
-        return Interview.objects.filter(
-            application__job__recruiter=self.recruiter,
-            scheduled_date__range=[today_start, today_end],
-            status='scheduled'
-        ).count()
-    
     def get_recent_activities(self, limit=10):
         """Get recent activities for dashboard"""
         activities = []
@@ -175,40 +221,47 @@ class RecruiterDashboardService:
         # Recent applications
         recent_apps = Application.objects.filter(
             job__recruiter=self.recruiter
-        ).select_related('seeker__user', 'job').order_by('-applied_at')[:5]
+        ).values(
+            'id', 'seeker__user__first_name', 'seeker__user__last_name', 'job__title', 'applied_at', 'status'
+        ).order_by('-applied_at')[:limit]
         
         for app in recent_apps:
             activities.append({
-                'id': app.id,
+                'id': app['id'],
                 'type': 'application',
-                'candidate': f"{app.seeker.user.first_name} {app.seeker.user.last_name}",
+                'candidate': f"{app['seeker__user__first_name']} {app['seeker__user__last_name']}",
                 'action': 'applied for',
-                'job': app.job.title,
-                'time': self._get_time_ago(app.applied_at),
-                'status': app.status,
+                'job': app['job__title'],
+                'time': app['applied_at'],  # formatted after sorting
+                'status': app['status'],
                 'icon': 'application'
             })
         
         # Recent interviews
         recent_interviews = Interview.objects.filter(
             application__job__recruiter=self.recruiter
-        ).select_related('application__seeker__user', 'application__job').order_by('-created_at')[:5]
+        ).values(
+            'id', 'application__seeker__user__first_name', 'application__seeker__user__last_name',
+            'application__job__title', 'created_at', 'status'
+        ).order_by('-created_at')[:limit]
         
         for interview in recent_interviews:
             activities.append({
-                'id': interview.id,
+                'id': interview['id'],
                 'type': 'interview',
-                'candidate': f"{interview.application.seeker.user.first_name} {interview.application.seeker.user.last_name}",
-                'action': f"{interview.status} interview for",  # FIXED: Changed single quote to double quote
-                'job': interview.application.job.title,
-                'time': self._get_time_ago(interview.created_at),
-                'status': interview.status,
+                'candidate': f"{interview['application__seeker__user__first_name']} {interview['application__seeker__user__last_name']}",
+                'action': f"{interview['status']} interview for",  # FIXED: Changed single quote to double quote
+                'job': interview['application__job__title'],
+                'time': interview['created_at'],  # formatted after sorting
+                'status': interview['status'],
                 'icon': 'interview'
             })
         
-        # Sort by time and return limited results
-        activities.sort(key=lambda x: x['time'], reverse=True)
-        return activities[:limit]
+        # Newest first by the raw timestamps, then render them as "time ago"
+        activities = heapq.nlargest(limit, activities, key=itemgetter('time'))
+        for activity in activities:
+            activity['time'] = self._get_time_ago(activity['time'])
+        return activities
     
     def get_top_performing_jobs(self, limit=5):
         """Get top performing jobs by application count"""
@@ -216,15 +269,20 @@ class RecruiterDashboardService:
             application_count=Count('applications'),
             avg_match_score=Avg('applications__match_score')
         ).order_by('-application_count')[:limit]
+        jobs = list(jobs)
+        
+        # Status breakdown for all of them in one grouped query
+        status_breakdown = defaultdict(dict)
+        status_counts = Application.objects.filter(
+            job__in=jobs
+        ).values('job_id', 'status').annotate(count=Count('id')).order_by()
+        for item in status_counts:
+            status_breakdown[item['job_id']][item['status']] = item['count']
         
         result = []
         for job in jobs:
             # Calculate match score average
             avg_score = job.avg_match_score or 0
-            applications = job.applications.all()
-            
-            # Get status breakdown
-            status_counts = applications.values('status').annotate(count=Count('status'))
             
             result.append({
                 'id': job.id,
@@ -232,7 +290,7 @@ class RecruiterDashboardService:
                 'applications': job.application_count,
                 'status': 'active' if job.is_active else 'inactive',
                 'match': f"{avg_score:.0f}%",
-                'status_breakdown': {item['status']: item['count'] for item in status_counts}
+                'status_breakdown': status_breakdown[job.id]
             })
         
         return result
@@ -245,8 +303,7 @@ class RecruiterDashboardService:
     
     def _get_time_ago(self, timestamp):
         """Convert timestamp to human readable time ago"""
-        now = timezone.now()
-        diff = now - timestamp
+        diff = self.now - timestamp
         
         if diff.days > 365:
             years = diff.days // 365
@@ -265,20 +322,11 @@ class RecruiterDashboardService:
         else:
             return "Just now"
 
-    def _get_hired_candidates(self, applications):
+    def _get_hired_candidates(self, counts):
         """Get hired candidates count"""
         # Count both accepted and hired statuses
-        hired = applications.filter(status__in=['accepted', 'hired']).count()
-        
-        # Calculate change from last month
-        last_month = timezone.now() - timedelta(days=30)
-        last_month_hired = applications.filter(
-            status__in=['accepted', 'hired'],
-            hired_date__isnull=False,
-            hired_date__lt=last_month
-        ).count()
-        
-        change = self._calculate_percentage_change(last_month_hired, hired)
+        hired = counts['hired']
+        change = self._calculate_percentage_change(counts['hired_last_month'], hired)
         
         return {
             'value': hired,
@@ -291,9 +339,18 @@ class AnalyticsService:
     
     def __init__(self, recruiter):
         self.recruiter = recruiter
+        self.now = timezone.now()
         
     def get_analytics_overview(self, time_range='month'):
         """Get detailed analytics overview"""
+        if time_range not in TIME_RANGES:
+            return self._compute_analytics_overview(time_range)
+        return _cached(
+            analytics_overview_cache_key(self.recruiter.id, time_range),
+            lambda: self._compute_analytics_overview(time_range),
+        )
+    
+    def _compute_analytics_overview(self, time_range):
         date_range = self._get_date_range(time_range)
         
         applications = Application.objects.filter(
@@ -318,7 +375,7 @@ class AnalyticsService:
 
     def _get_date_range(self, time_range):
         """Get date range based on time filter"""
-        now = timezone.now()
+        now = self.now
         
         if time_range == 'week':
             start_date = now - timedelta(days=7)
@@ -334,51 +391,44 @@ class AnalyticsService:
         return [start_date, now]
     
     def _get_applications_over_time(self, applications, time_range):
-        """Get applications count grouped by time period"""
-        if time_range == 'week':
-            # Group by day
-            dates = {}
-            for i in range(7):
-                date = (timezone.now() - timedelta(days=i)).date()
-                dates[date.strftime('%a')] = applications.filter(
-                    applied_at__date=date
-                ).count()
-            return dates
-            
-        elif time_range == 'month':
-            # Group by week
-            weeks = {}
-            for i in range(4):
-                week_start = timezone.now() - timedelta(days=7*(i+1))
-                week_end = timezone.now() - timedelta(days=7*i)
-                week_key = f"Week {i+1}"
-                weeks[week_key] = applications.filter(
-                    applied_at__range=[week_start, week_end]
-                ).count()
-            return weeks
+        """Get applications count grouped by time period (one query per call)"""
+        now = self.now
+        
+        if time_range == 'month':
+            # Group by rolling week
+            counts = applications.aggregate(**{
+                f"week_{i+1}": Count('id', filter=Q(
+                    applied_at__range=[now - timedelta(days=7*(i+1)), now - timedelta(days=7*i)]
+                ))
+                for i in range(4)
+            })
+            return {f"Week {i+1}": counts[f"week_{i+1}"] for i in range(4)}
             
         elif time_range == 'year':
             # Group by month
+            per_month = self._count_applications_by(applications, TruncMonth('applied_at'))
+            per_month = {(month.year, month.month): count for month, count in per_month.items()}
             months = {}
             for i in range(12):
-                month_date = timezone.now() - timedelta(days=30*(i+1))
-                month_name = calendar.month_name[month_date.month]
-                month_key = f"{month_name[:3]}"
-                months[month_key] = applications.filter(
-                    applied_at__month=month_date.month,
-                    applied_at__year=month_date.year
-                ).count()
+                month_date = now - timedelta(days=30*(i+1))
+                months[month_date.strftime('%b')] = per_month.get((month_date.year, month_date.month), 0)
             return months
         
-        # Default: return by day for the last 7 days
+        # Default (and week): return by day for the last 7 days
+        per_day = self._count_applications_by(applications, TruncDate('applied_at'))
         dates = {}
         for i in range(7):
-            date = (timezone.now() - timedelta(days=i)).date()
-            dates[date.strftime('%a')] = applications.filter(
-                applied_at__date=date
-            ).count()
+            date = (now - timedelta(days=i)).date()
+            dates[date.strftime('%a')] = per_day.get(date, 0)
         return dates
     
+    def _count_applications_by(self, applications, period):
+        """Map each period to its application count with a single GROUP BY"""
+        rows = applications.annotate(
+            period=period
+        ).values('period').annotate(count=Count('id')).order_by()
+        return {row['period']: row['count'] for row in rows}
+    
     def _calculate_hire_rate(self, applications):
         """Calculate hire rate percentage"""
         total = applications.count()
@@ -399,49 +449,37 @@ class AnalyticsService:
         """Get performance metrics by department"""
         date_range = self._get_date_range(time_range)
         
-        departments = {}
-        jobs = Job.objects.filter(
+        # Applications are distinct so the interview join doesn't multiply them
+        rows = Job.objects.filter(
             recruiter=self.recruiter,
-            created_at__range=date_range
-        ).select_related('department')
-        
-        for job in jobs:
-            if job.department:
-                dept_name = job.department.name
-                if dept_name not in departments:
-                    departments[dept_name] = {
-                        'applications': 0,
-                        'interviews': 0,
-                        'hires': 0,
-                        'open_roles': 0
-                    }
-                
-                # Get applications for this job
-                job_applications = job.applications.all()
-                departments[dept_name]['applications'] += job_applications.count()
-                
-                # Count interviews
-                departments[dept_name]['interviews'] += job_applications.filter(
-                    interviews__status='scheduled'
-                ).count()
-                
-                # Count hires (both accepted and hired statuses)
-                departments[dept_name]['hires'] += job_applications.filter(
-                    status__in=['accepted', 'hired']
-                ).count()
+            created_at__range=date_range,
+            department__isnull=False
+        ).values('department__name').annotate(
+            application_count=Count('applications', distinct=True),
+            interview_count=Count('applications__interviews', filter=Q(applications__interviews__status='scheduled')),
+            hire_count=Count('applications', filter=Q(applications__status__in=HIRED_STATUSES), distinct=True),
+        ).order_by('department__name')
+        
+        departments = {
+            row['department__name']: {
+                'applications': row['application_count'],
+                'interviews': row['interview_count'],
+                'hires': row['hire_count'],
+                'open_roles': 0
+            }
+            for row in rows
+        }
         
         # Add open roles count
-        active_jobs = Job.objects.filter(
+        open_roles = Job.objects.filter(
             recruiter=self.recruiter,
             is_active=True,
-            is_published=True
-        )
+            is_published=True,
+            department__name__in=departments
+        ).values('department__name').annotate(count=Count('id')).order_by()
         
-        for job in active_jobs:
-            if job.department:
-                dept_name = job.department.name
-                if dept_name in departments:
-                    departments[dept_name]['open_roles'] += 1
+        for row in open_roles:
+            departments[row['department__name']]['open_roles'] = row['count']
         
         return departments
     
@@ -458,18 +496,7 @@ class AnalyticsService:
         avg_score = applications.aggregate(avg=Avg('match_score'))['avg'] or 0
         
         # Top skills from applications
-        all_skills = []
-        for app in applications:
-            if app.skills and isinstance(app.skills, list):
-                # Extract skill names from the skills JSONField
-                for skill_data in app.skills:
-                    if isinstance(skill_data, dict) and 'name' in skill_data:
-                        all_skills.append(skill_data['name'])
-        
-        # Count skill occurrences
-        from collections import Counter
-        skill_counts = Counter(all_skills)
-        top_skills = [skill[0] for skill in skill_counts.most_common(5)]
+        top_skills = self._get_top_skills(applications)
         
         # Since you don't have experience levels in your model yet
         # Return default empty data
@@ -481,19 +508,44 @@ class AnalyticsService:
             'experience_levels': experience_levels
         }
     
+    def _get_top_skills(self, applications, limit=5):
+        """Most common skill names in the applications' skills JSON lists"""
+        if connection.vendor == 'postgresql':
+            # Unnest the JSONB lists and tally the names server-side
+            ids_sql, ids_params = applications.order_by().values('id').query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT skill->>'name', COUNT(*) "
+                    f"FROM {connection.ops.quote_name(Application._meta.db_table)} app "
+                    "CROSS JOIN LATERAL jsonb_array_elements("
+                    "CASE WHEN jsonb_typeof(app.skills) = 'array' THEN app.skills ELSE '[]'::jsonb END"
+                    ") AS skill "
+                    f"WHERE app.id IN ({ids_sql}) AND jsonb_typeof(skill) = 'object' AND skill ? 'name' "
+                    "GROUP BY 1 ORDER BY 2 DESC LIMIT %s",
+                    [*ids_params, limit],
+                )
+                return [name for name, _ in cursor.fetchall()]
+        
+        # Count skill names from the skills JSONField as they stream past
+        skill_counts = Counter(
+            skill_data['name']
+            for skills in applications.values_list('skills', flat=True).iterator(chunk_size=500)
+            if skills and isinstance(skills, list)
+            for skill_data in skills
+            if isinstance(skill_data, dict) and 'name' in skill_data
+        )
+        return [skill[0] for skill in skill_counts.most_common(limit)]
+    
     def _get_time_metrics(self, applications, interviews):
         """Get time-based metrics"""
         metrics = {}
         
-        # Average time to first response
-        responded_apps = applications.filter(last_message_at__isnull=False)
-        if responded_apps.exists():
-            total_hours = 0
-            for app in responded_apps:
-                if app.last_message_at and app.applied_at:
-                    hours = (app.last_message_at - app.applied_at).total_seconds() / 3600
-                    total_hours += hours
-            metrics['avg_response_time'] = f"{total_hours / responded_apps.count():.1f} hours"
+        # Average time to first response, averaged by the DB instead of row by row
+        avg_response = applications.filter(last_message_at__isnull=False).aggregate(
+            avg=Avg(ExpressionWrapper(F('last_message_at') - F('applied_at'), output_field=DurationField()))
+        )['avg']
+        if avg_response is not None:
+            metrics['avg_response_time'] = f"{avg_response.total_seconds() / 3600:.1f} hours"
         else:
             metrics['avg_response_time'] = "N/A"
         
@@ -0,0 +1,46 @@
+# analytics/signals.py
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from applications.models import Application, Interview
+from chat.models import Conversation
+from jobs.models import Job
+from .services import invalidate_recruiter_dashboard
+
+
+@receiver(post_save, sender=Job, dispatch_uid='analytics_job_saved_dashboard_cache')
+@receiver(post_delete, sender=Job, dispatch_uid='analytics_job_deleted_dashboard_cache')
+@receiver(post_save, sender=Conversation, dispatch_uid='analytics_conversation_saved_dashboard_cache')
+def recruiter_dashboard_cache_handler(sender, instance, **kwargs):
+    """Jobs and conversations carry the recruiter directly"""
+    invalidate_recruiter_dashboard(instance.recruiter_id)
+
+def _application_recruiter_id(application):
+    """Recruiter of an application's job, from the loaded job when there is one"""
+    if Application.job.is_cached(application):
+        return application.job.recruiter_id
+    return Job.objects.filter(pk=application.job_id).values_list('recruiter_id', flat=True).first()
+
+@receiver(post_save, sender=Application, dispatch_uid='analytics_application_saved_dashboard_cache')
+@receiver(post_delete, sender=Application, dispatch_uid='analytics_application_deleted_dashboard_cache')
+def application_dashboard_cache_handler(sender, instance, **kwargs):
+    if not settings.DASHBOARD_CACHE_TIMEOUT:
+        return
+    recruiter_id = _application_recruiter_id(instance)
+    if recruiter_id:
+        invalidate_recruiter_dashboard(recruiter_id)
+
+@receiver(post_save, sender=Interview, dispatch_uid='analytics_interview_saved_dashboard_cache')
+@receiver(post_delete, sender=Interview, dispatch_uid='analytics_interview_deleted_dashboard_cache')
+def interview_dashboard_cache_handler(sender, instance, **kwargs):
+    if not settings.DASHBOARD_CACHE_TIMEOUT:
+        return
+    if Interview.application.is_cached(instance):
+        recruiter_id = _application_recruiter_id(instance.application)
+    else:
+        recruiter_id = Application.objects.filter(
+            pk=instance.application_id
+        ).values_list('job__recruiter_id', flat=True).first()
+    if recruiter_id:
+        invalidate_recruiter_dashboard(recruiter_id)
@@ -1,3 +1,205 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import CustomUser, JobSeeker, Recruiter
+from applications.models import Application, Interview
+from chat.models import Conversation
+from companies.models import Company
+from jobs.models import Department, Job
+from .services import AnalyticsService, RecruiterDashboardService
+
+PASSWORD = 'Sup3r-secret-pass'
+
+
+@override_settings(DASHBOARD_CACHE_TIMEOUT=0)
+class RecruiterAnalyticsTests(TestCase):
+    """Dashboard stats and analytics overviews over a seeded recruiter"""
+
+    def setUp(self):
+        self.now = timezone.now()
+        company = Company.objects.create(name='Acme', description='Widgets', industry='Technology', location='Kathmandu')
+        user = CustomUser.objects.create_user('recruiter@example.com', PASSWORD, role='recruiter')
+        self.recruiter = Recruiter.objects.create(
+            user=user, company=company, designation='Recruiter', phone_number='9800000000'
+        )
+        engineering = Department.objects.create(name='Engineering')
+        operations = Department.objects.create(name='Operations')
+        backend = self.make_job('Backend Engineer', engineering)
+        support = self.make_job('Support Lead', operations)
+        legacy = self.make_job('Legacy Engineer', engineering, is_active=False)
+        seekers = [self.make_seeker(f'seeker{i}@example.com') for i in range(4)]
+
+        # status, days since applying, days from applying to the offer, match score, skills, hours to first reply
+        hired = self.make_application(backend, seekers[0], 'hired', 3, 2, 80, ['Python', 'Django'], 4)
+        interviewing = self.make_application(backend, seekers[1], 'interview', 10, None, 60, ['Python'], None)
+        accepted = self.make_application(support, seekers[2], 'accepted', 60, 10, 90, ['SQL'], 2)
+        fresh = self.make_application(support, seekers[3], 'new', 0, None, 50, ['Python'], None)
+        self.make_application(legacy, seekers[0], 'rejected', 200, None, 40, [], None)
+
+        self.make_interview(interviewing, self.now, 'scheduled')
+        self.make_interview(hired, self.now - timedelta(days=2), 'completed')
+        self.make_interview(fresh, self.now + timedelta(days=5), 'scheduled')
+        self.make_interview(accepted, self.now - timedelta(days=40), 'scheduled')
+
+        # Applying opens a conversation per seeker; give two of them unread messages
+        Conversation.objects.filter(recruiter=self.recruiter).update(unread_by_recruiter=0)
+        Conversation.objects.filter(job_seeker=seekers[0]).update(unread_by_recruiter=3)
+        Conversation.objects.filter(job_seeker=seekers[1]).update(unread_by_recruiter=2)
+
+    def make_job(self, title, department, is_active=True):
+        return Job.objects.create(
+            recruiter=self.recruiter, title=title, description='Build things', location='Kathmandu',
+            department=department, job_type='full_time', requirements='Experience', is_active=is_active,
+        )
+
+    def make_seeker(self, email):
+        user = CustomUser.objects.create_user(email, PASSWORD, role='job_seeker')
+        return JobSeeker.objects.create(user=user, phone_number='9800000000')
+
+    def make_application(self, job, seeker, status, days_ago, days_to_offer, match_score, skills, hours_to_reply):
+        application = Application.objects.create(
+            job=job, seeker=seeker, status=status, match_score=match_score,
+            skills=[{'name': name, 'rating': 4} for name in skills],
+        )
+        if days_ago:
+            applied_at = self.now - timedelta(days=days_ago)
+        else:
+            applied_at = application.applied_at
+        fields = {'applied_at': applied_at}
+        if days_to_offer is not None:
+            fields['offer_date'] = fields['hired_date'] = applied_at + timedelta(days=days_to_offer)
+        if hours_to_reply is not None:
+            fields['last_message_at'] = applied_at + timedelta(hours=hours_to_reply)
+        # applied_at is auto_now_add, so backdate with an UPDATE
+        Application.objects.filter(pk=application.pk).update(**fields)
+        return application
+
+    def make_interview(self, application, scheduled_date, status):
+        return Interview.objects.create(
+            application=application, scheduled_date=scheduled_date, interview_type='video',
+            status=status, scheduled_by=self.recruiter,
+        )
+
+    def test_dashboard_stats(self):
+        stats = RecruiterDashboardService(self.recruiter).get_dashboard_stats()
+
+        self.assertEqual(stats['total_applications'], {'value': 5, 'change': '150.0%', 'trend': 'up'})
+        self.assertEqual(stats['active_jobs'], {'value': 2, 'change': '1 inactive', 'trend': 'up'})
+        self.assertEqual(stats['interview_scheduled'], {'value': 3, 'change': '50.0%', 'trend': 'up'})
+        self.assertEqual(stats['avg_time_to_hire'], {'value': '6.0 days', 'change': '-4.0 days', 'trend': 'up'})
+        self.assertEqual(stats['unread_messages'], {'value': 5, 'change': '5 unread', 'trend': 'up'})
+        self.assertEqual(stats['applications_today'], 1)
+        self.assertEqual(stats['interviews_today'], 1)
+        self.assertEqual(stats['hired_candidates'], {'value': 2, 'change': '100.0%', 'trend': 'up'})
+
+    def test_quick_stats(self):
+        tiles = RecruiterDashboardService(self.recruiter).get_quick_stats()
+
+        self.assertEqual(tiles, [
+            {'title': 'Total Applications', 'value': 5, 'change': '150.0%', 'trend': 'up'},
+            {'title': 'Active Jobs', 'value': 2, 'change': '1 inactive', 'trend': 'up'},
+            {'title': 'Interviews Today', 'value': 1, 'change': 'Today', 'trend': 'neutral'},
+            {'title': 'Unread Messages', 'value': 5, 'change': '5 unread', 'trend': 'up'},
+        ])
+
+    def test_dashboard_stats_without_data(self):
+        user = CustomUser.objects.create_user('idle@example.com', PASSWORD, role='recruiter')
+        idle = Recruiter.objects.create(
+            user=user, company=self.recruiter.company, designation='Recruiter', phone_number='9800000000'
+        )
+
+        stats = RecruiterDashboardService(idle).get_dashboard_stats()
+
+        self.assertEqual(stats['total_applications'], {'value': 0, 'change': '0%', 'trend': 'down'})
+        self.assertEqual(stats['avg_time_to_hire'], {'value': 'N/A', 'change': '0%', 'trend': 'neutral'})
+        self.assertEqual(stats['unread_messages']['value'], 0)
+
+    def test_analytics_overview_per_time_range(self):
+        # The jobs were all created just now, so every range sees the same departments
+        departments = {
+            'Engineering': {'applications': 3, 'interviews': 1, 'hires': 1, 'open_roles': 1},
+            'Operations': {'applications': 2, 'interviews': 2, 'hires': 1, 'open_roles': 1},
+        }
+        expected = {
+            'week': (50.0, 1, 65.0, ['Python', 'Django'], '4.0 hours', '50.0%'),
+            'month': (33.3, 1, 63.3, ['Python', 'Django'], '4.0 hours', '50.0%'),
+            'quarter': (50.0, 2, 70.0, ['Python', 'Django', 'SQL'], '3.0 hours', '33.3%'),
+            'year': (40.0, 2, 64.0, ['Python', 'Django', 'SQL'], '3.0 hours', '33.3%'),
+        }
+        for time_range, (hire_rate, hires, match_score, skills, response, completion) in expected.items():
+            with self.subTest(time_range=time_range):
+                overview = AnalyticsService(self.recruiter).get_analytics_overview(time_range)
+
+                self.assertEqual(overview['hire_rate'], hire_rate)
+                self.assertEqual(overview['total_hires'], hires)
+                self.assertEqual(overview['source_breakdown'], {})
+                self.assertEqual(overview['department_performance'], departments)
+                quality = overview['candidate_quality']
+                self.assertEqual(quality['avg_match_score'], match_score)
+                self.assertEqual(quality['top_skills'][0], 'Python')
+                self.assertCountEqual(quality['top_skills'], skills)
+                self.assertEqual(overview['time_metrics'], {
+                    'avg_response_time': response,
+                    'interview_completion_rate': completion,
+                })
+
+    def test_applications_over_time_buckets(self):
+        service = AnalyticsService(self.recruiter)
+        days = [(service.now - timedelta(days=i)).strftime('%a') for i in range(7)]
+
+        week = service.get_analytics_overview('week')['applications_over_time']
+        self.assertEqual(list(week), days)
+        self.assertEqual(sum(week.values()), 2)
+
+        month = service.get_analytics_overview('month')['applications_over_time']
+        self.assertEqual(month, {'Week 1': 2, 'Week 2': 1, 'Week 3': 0, 'Week 4': 0})
+
+        quarter = service.get_analytics_overview('quarter')['applications_over_time']
+        self.assertEqual(quarter, week)
+
+        year = service.get_analytics_overview('year')['applications_over_time']
+        self.assertEqual(year[(service.now - timedelta(days=60)).strftime('%b')], 1)
+
+    def test_unknown_time_range_falls_back_to_a_month(self):
+        service = AnalyticsService(self.recruiter)
+
+        overview = service.get_analytics_overview('decade')
+
+        self.assertEqual(overview['hire_rate'], 33.3)
+        self.assertEqual(len(overview['applications_over_time']), 7)
+
+    def test_no_applications_in_range(self):
+        Application.objects.update(applied_at=self.now - timedelta(days=400))
+
+        overview = AnalyticsService(self.recruiter).get_analytics_overview('year')
+
+        self.assertEqual(overview['hire_rate'], 0)
+        self.assertEqual(overview['candidate_quality'], {'avg_match_score': 0, 'top_skills': [], 'experience_levels': {}})
+        self.assertEqual(overview['time_metrics']['avg_response_time'], 'N/A')
+
+    # The fallback used off PostgreSQL, whatever database the tests run on
+    @mock.patch('analytics.services.connection', mock.Mock(vendor='sqlite'))
+    def test_top_skills_counter_skips_malformed_entries(self):
+        service = AnalyticsService(self.recruiter)
+        applications = Application.objects.filter(job__recruiter=self.recruiter)
+        rejected = applications.get(status='rejected')
+        malformed = [
+            {'name': 'Django'},
+            ['Rust', {'rating': 5}, {'name': 'SQL'}],
+            'Go',
+            42,
+        ]
+        for skills in malformed:
+            with self.subTest(skills=skills):
+                Application.objects.filter(pk=rejected.pk).update(skills=skills)
+
+                top = service._get_top_skills(applications)
+
+                self.assertEqual(top[0], 'Python')
+                self.assertNotIn('Rust', top)
+                self.assertNotIn('Go', top)
+
+        self.assertEqual(service._get_top_skills(applications, limit=1), ['Python'])
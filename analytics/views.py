@@ -3,22 +3,33 @@ import logging
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import PermissionDenied
 from .services import RecruiterDashboardService, AnalyticsService
 from accounts.models import Recruiter
+from accounts.permissions import IsRecruiter
 
 # Get logger
 logger = logging.getLogger('accounts')  # Using accounts logger or you can create a separate dashboard logger
 
+def get_recruiter(user, with_company=False):
+    """Recruiter profile of a user IsRecruiter has already let through"""
+    recruiters = Recruiter.objects.select_related('company') if with_company else Recruiter.objects
+    try:
+        return recruiters.get(user=user)
+    except Recruiter.DoesNotExist:
+        logger.warning("Recruiter user %s has no recruiter profile", user.id)
+        raise PermissionDenied(IsRecruiter.message)
+
 class RecruiterDashboardAPIView(APIView):
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsRecruiter]
     
     def get(self, request):
         user = request.user
         logger.info(f"Dashboard accessed - User ID: {user.id}, Email: {user.email}")
         
+        recruiter = get_recruiter(user, with_company=True)
+        
         try:
-            recruiter = Recruiter.objects.get(user=user)
             logger.debug(f"Recruiter found - ID: {recruiter.id}, Company: {recruiter.company.name if recruiter.company else 'No Company'}")
             
             service = RecruiterDashboardService(recruiter)
@@ -32,12 +43,6 @@ class RecruiterDashboardAPIView(APIView):
             logger.info(f"Dashboard data retrieved successfully for recruiter {recruiter.id}")
             return Response(data, status=status.HTTP_200_OK)
             
-        except Recruiter.DoesNotExist:
-            logger.warning(f"Non-recruiter user {user.id} attempted to access recruiter dashboard")
-            return Response(
-                {'error': 'User is not a recruiter'},
-                status=status.HTTP_403_FORBIDDEN
-            )
         except Exception as e:
             logger.error(f"Error in dashboard for user {user.id}: {str(e)}", exc_info=True)
             return Response(
@@ -46,15 +51,16 @@ class RecruiterDashboardAPIView(APIView):
             )
 
 class AnalyticsAPIView(APIView):
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsRecruiter]
     
     def get(self, request):
         user = request.user
         time_range = request.GET.get('time_range', 'month')
         logger.info(f"Analytics accessed - User ID: {user.id}, Time Range: {time_range}")
         
+        recruiter = get_recruiter(user)
+        
         try:
-            recruiter = Recruiter.objects.get(user=user)
             logger.debug(f"Recruiter found - ID: {recruiter.id}")
             
             service = AnalyticsService(recruiter)
@@ -64,12 +70,6 @@ class AnalyticsAPIView(APIView):
             logger.info(f"Analytics data retrieved successfully for recruiter {recruiter.id}")
             return Response(data, status=status.HTTP_200_OK)
             
-        except Recruiter.DoesNotExist:
-            logger.warning(f"Non-recruiter user {user.id} attempted to access analytics")
-            return Response(
-                {'error': 'User is not a recruiter'},
-                status=status.HTTP_403_FORBIDDEN
-            )
         except Exception as e:
             logger.error(f"Error in analytics for user {user.id}: {str(e)}", exc_info=True)
             return Response(
@@ -78,57 +78,24 @@ class AnalyticsAPIView(APIView):
             )
 
 class QuickStatsAPIView(APIView):
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsRecruiter]
     
     def get(self, request):
         user = request.user
         logger.info(f"Quick stats accessed - User ID: {user.id}")
         
+        recruiter = get_recruiter(user)
+        
         try:
-            recruiter = Recruiter.objects.get(user=user)
             logger.debug(f"Recruiter found - ID: {recruiter.id}")
             
             service = RecruiterDashboardService(recruiter)
             
-            stats = service.get_dashboard_stats()
-            
-            # Format for quick stats display
-            quick_stats = [
-                {
-                    'title': 'Total Applications',
-                    'value': stats['total_applications']['value'],
-                    'change': stats['total_applications']['change'],
-                    'trend': stats['total_applications']['trend']
-                },
-                {
-                    'title': 'Active Jobs',
-                    'value': stats['active_jobs']['value'],
-                    'change': stats['active_jobs']['change'],
-                    'trend': stats['active_jobs']['trend']
-                },
-                {
-                    'title': 'Interviews Today',
-                    'value': service._get_interviews_today(),
-                    'change': 'Today',
-                    'trend': 'neutral'
-                },
-                {
-                    'title': 'Unread Messages',
-                    'value': stats['unread_messages']['value'],
-                    'change': stats['unread_messages']['change'],
-                    'trend': stats['unread_messages']['trend']
-                }
-            ]
+            quick_stats = service.get_quick_stats()
             
             logger.info(f"Quick stats retrieved successfully for recruiter {recruiter.id}")
             return Response(quick_stats, status=status.HTTP_200_OK)
             
-        except Recruiter.DoesNotExist:
-            logger.warning(f"Non-recruiter user {user.id} attempted to access quick stats")
-            return Response(
-                {'error': 'User is not a recruiter'},
-                status=status.HTTP_403_FORBIDDEN
-            )
         except Exception as e:
             logger.error(f"Error in quick stats for user {user.id}: {str(e)}", exc_info=True)
             return Response(
@@ -1,8 +1,15 @@
+from django.conf import settings
 from django.contrib import admin
-from django.utils.html import format_html
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+from django.utils.html import format_html, format_html_join
 from django.urls import reverse
-from django.db.models import Count, Avg, Q, Exists, OuterRef
+from django.db.models import Count, Avg, Q, F, Exists, OuterRef
 from django.utils import timezone
+from accounts.admin import is_changelist
+from analytics.services import invalidate_recruiter_dashboards
+from jobs.models import Job
 from .models import Application, ApplicationNote, Interview, CandidateTag, CandidateCommunication
 
 
@@ -50,6 +57,109 @@ class CandidateCommunicationInline(admin.TabularInline):
     classes = ('collapse',)
 
 
+# ========== PAGINATION ==========
+class FasterAdminPaginator(Paginator):
+    """Use PostgreSQL's row estimate instead of COUNT(*) for unfiltered changelists.
+
+    Estimates below ESTIMATE_THRESHOLD (or a table that was never analyzed)
+    still get an exact count, so small tables page exactly.
+    """
+    ESTIMATE_THRESHOLD = 10000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if connection.vendor == 'postgresql' and query is not None and not query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [self.object_list.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.ESTIMATE_THRESHOLD:
+                return row[0]
+        return super().count
+
+
+# ========== LIST FILTERS ==========
+class RecruiterListFilter(admin.RelatedFieldListFilter):
+    """Recruiter filter whose labels (user email + company) come from one query"""
+
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        recruiters = field.related_model._default_manager.select_related('user', 'company')
+        if ordering:
+            recruiters = recruiters.order_by(*ordering)
+        return [(recruiter.pk, str(recruiter)) for recruiter in recruiters]
+
+
+# ========== BADGE FRAGMENTS ==========
+# Built once at import – the badge markup only varies by status/type
+_BADGE_HTML = ('<span style="background-color: {}; color: white; padding: 3px 8px; '
+               'border-radius: 12px; font-size: 11px;">{}</span>')
+_DEFAULT_BADGE_COLOR = '#6c757d'
+
+_APPLICATION_STATUS_CONFIG = {
+    'new': ('#17a2b8', '🆕'),
+    'pending': ('#ffc107', '⏳'),
+    'reviewed': ('#6c757d', '👁️'),
+    'shortlisted': ('#28a745', '⭐'),
+    'interview': ('#007bff', '👔'),
+    'offer': ('#20c997', '📄'),
+    'hired': ('#28a745', '✅'),
+    'rejected': ('#dc3545', '❌'),
+    'accepted': ('#28a745', '✅'),
+    'withdrawn': ('#343a40', '🚪'),
+}
+_APPLICATION_STATUS_BADGE_HTML = ('<span style="background-color: {}; color: white; padding: 3px 8px; '
+                                  'border-radius: 12px; font-size: 11px; font-weight: bold;">{} {}</span>')
+# Labelled from the model's display map, which differs from its choices
+_APPLICATION_STATUS_HTML = {
+    status: format_html(_APPLICATION_STATUS_BADGE_HTML, color, icon, Application.STATUS_DISPLAY.get(status, status))
+    for status, (color, icon) in _APPLICATION_STATUS_CONFIG.items()
+}
+
+# (minimum score, color, label), best first; anything below the last is Poor
+_MATCH_TIERS = (
+    (80, '#28a745', 'Excellent'),
+    (60, '#17a2b8', 'Good'),
+    (40, '#ffc107', 'Fair'),
+)
+_MATCH_BAR_HTML = (
+    '<div style="min-width: 120px;">'
+    '<div style="height: 8px; background: #e9ecef; border-radius: 4px; margin-bottom: 3px;">'
+    '<div style="height: 8px; background-color: {}; border-radius: 4px; width: {}%"></div>'
+    '</div>'
+    '<small><span style="color: {};">{}</span> {}%</small>'
+    '</div>'
+)
+
+_INTERVIEW_TYPE_COLORS = {'phone': '#17a2b8', 'video': '#007bff', 'onsite': '#ffc107', 'technical': '#dc3545'}
+_INTERVIEW_STATUS_COLORS = {'scheduled': '#17a2b8', 'completed': '#28a745', 'cancelled': '#dc3545', 'rescheduled': '#ffc107'}
+_COMMUNICATION_TYPE_COLORS = {'email': '#007bff', 'call': '#17a2b8', 'message': '#28a745', 'interview': '#ffc107', 'offer': '#dc3545'}
+
+
+def _badges_for(model, field_name, colors):
+    """Pre-rendered badge per choice of model.field_name"""
+    return {
+        value: format_html(_BADGE_HTML, colors.get(value, _DEFAULT_BADGE_COLOR), label)
+        for value, label in model._meta.get_field(field_name).choices
+    }
+
+
+def _labels_for(model, field_name):
+    """Choice value -> label for model.field_name, without the per-call get_FOO_display field lookup"""
+    return dict(model._meta.get_field(field_name).choices)
+
+
+_JOB_TYPE_LABELS = _labels_for(Job, 'job_type')
+_EXPERIENCE_LEVEL_LABELS = _labels_for(Job, 'experience_level')
+
+_INTERVIEW_TYPE_HTML = _badges_for(Interview, 'interview_type', _INTERVIEW_TYPE_COLORS)
+_INTERVIEW_STATUS_HTML = _badges_for(Interview, 'status', _INTERVIEW_STATUS_COLORS)
+_COMMUNICATION_TYPE_HTML = _badges_for(CandidateCommunication, 'communication_type', _COMMUNICATION_TYPE_COLORS)
+
+
 # ========== APPLICATION ADMIN ==========
 @admin.register(Application)
 class ApplicationAdmin(admin.ModelAdmin):
@@ -146,6 +256,7 @@ class ApplicationAdmin(admin.ModelAdmin):
 
     list_per_page = 25
     date_hierarchy = 'applied_at'
+    paginator = FasterAdminPaginator
     list_select_related = ('seeker__user', 'job__recruiter__company')  # prefetch in main query
     actions = [
         'mark_as_shortlisted',
@@ -156,6 +267,12 @@ class ApplicationAdmin(admin.ModelAdmin):
         'export_applications_csv'
     ]
     show_full_result_count = False           # eliminate duplicate COUNT(*)
+    changelist_fields = (
+        'status', 'match_score', 'applied_at', 'last_active', 'is_favorite', 'is_archived', 'offer_made',
+        'seeker__phone_number', 'seeker__location',
+        'seeker__user__first_name', 'seeker__user__last_name', 'seeker__user__email',
+        'job__title', 'job__job_type', 'job__experience_level', 'job__recruiter__company__name',
+    )
 
     # Read‑only permissions (view only, but actions can modify)
     def has_add_permission(self, request):
@@ -168,13 +285,6 @@ class ApplicationAdmin(admin.ModelAdmin):
     def has_delete_permission(self, request, obj=None):
         return False
 
-    # Helper to safely get status display (handles if get_status_display is a method or property)
-    def get_status_display_safe(self, obj):
-        value = obj.get_status_display
-        if callable(value):
-            return value()
-        return value
-
     def application_id(self, obj):
         return format_html('<strong>#{}</strong>', obj.id)
     application_id.short_description = 'ID'
@@ -209,57 +319,27 @@ class ApplicationAdmin(admin.ModelAdmin):
             '</div>',
             job_url,
             obj.job.title[:30] + "..." if len(obj.job.title) > 30 else obj.job.title,
-            obj.job.get_job_type_display(),
-            obj.job.get_experience_level_display(),
+            _JOB_TYPE_LABELS.get(obj.job.job_type, obj.job.job_type),
+            _EXPERIENCE_LEVEL_LABELS.get(obj.job.experience_level, obj.job.experience_level),
             company.name[:20] + "..." if company and len(company.name) > 20 else (company.name if company else 'No company')
         )
     job_info.short_description = 'Job'
 
     def application_status(self, obj):
-        status_config = {
-            'new': ('#17a2b8', '🆕'),
-            'pending': ('#ffc107', '⏳'),
-            'reviewed': ('#6c757d', '👁️'),
-            'shortlisted': ('#28a745', '⭐'),
-            'interview': ('#007bff', '👔'),
-            'offer': ('#20c997', '📄'),
-            'hired': ('#28a745', '✅'),
-            'rejected': ('#dc3545', '❌'),
-            'accepted': ('#28a745', '✅'),
-            'withdrawn': ('#343a40', '🚪'),
-        }
-        color, icon = status_config.get(obj.status, ('#6c757d', '❓'))
-        # Use safe display helper
-        status_display = self.get_status_display_safe(obj)
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 8px; '
-            'border-radius: 12px; font-size: 11px; font-weight: bold;">{} {}</span>',
-            color, icon, status_display
-        )
+        badge = _APPLICATION_STATUS_HTML.get(obj.status)
+        if badge is None:
+            badge = format_html(_APPLICATION_STATUS_BADGE_HTML, _DEFAULT_BADGE_COLOR, '❓',
+                                Application.STATUS_DISPLAY.get(obj.status, obj.status))
+        return badge
     application_status.short_description = 'Status'
 
     def match_score_bar(self, obj):
-        if obj.match_score >= 80:
-            color = '#28a745'
-            label = 'Excellent'
-        elif obj.match_score >= 60:
-            color = '#17a2b8'
-            label = 'Good'
-        elif obj.match_score >= 40:
-            color = '#ffc107'
-            label = 'Fair'
+        for threshold, color, label in _MATCH_TIERS:
+            if obj.match_score >= threshold:
+                break
         else:
-            color = '#dc3545'
-            label = 'Poor'
-        return format_html(
-            '<div style="min-width: 120px;">'
-            '<div style="height: 8px; background: #e9ecef; border-radius: 4px; margin-bottom: 3px;">'
-            '<div style="height: 8px; background-color: {}; border-radius: 4px; width: {}%"></div>'
-            '</div>'
-            '<small><span style="color: {};">{}</span> {}%</small>'
-            '</div>',
-            color, obj.match_score, color, label, obj.match_score
-        )
+            color, label = '#dc3545', 'Poor'
+        return format_html(_MATCH_BAR_HTML, color, obj.match_score, color, label, obj.match_score)
     match_score_bar.short_description = 'Match'
 
     def applied_date(self, obj):
@@ -334,12 +414,8 @@ class ApplicationAdmin(admin.ModelAdmin):
             profile_score = 0
             fields = ['title', 'bio', 'phone_number', 'location', 'resume']
             profile_score = sum(10 for field in fields if getattr(seeker, field) and len(str(getattr(seeker, field)).strip()) > 0)
-            if seeker.experiences.exists():
-                profile_score += 10
-            if seeker.educations.exists():
-                profile_score += 10
-            if seeker.skills.exists():
-                profile_score += 10
+            # Denormalized counters on JobSeeker – no EXISTS query per relation
+            profile_score += sum(10 for count in (seeker.experiences_count, seeker.educations_count, seeker.skills_count) if count)
             return format_html(
                 '<div style="background: #e8f4fd; padding: 15px; border-radius: 8px; margin-bottom: 20px;">'
                 '<h4 style="margin-top: 0;">Candidate Details</h4>'
@@ -372,8 +448,8 @@ class ApplicationAdmin(admin.ModelAdmin):
                 job.title,
                 company.name if company else 'Not specified',
                 job.location,
-                job.get_job_type_display(),
-                job.get_experience_level_display(),
+                _JOB_TYPE_LABELS.get(job.job_type, job.job_type),
+                _EXPERIENCE_LEVEL_LABELS.get(job.experience_level, job.experience_level),
                 job.salary_display if hasattr(job, 'salary_display') else 'Not specified'
             )
         return format_html('<p>Save the application to see job details</p>')
@@ -388,19 +464,22 @@ class ApplicationAdmin(admin.ModelAdmin):
                 events.append(('💬', 'Last Message', obj.last_message_at))
             if obj.last_active:
                 events.append(('🔄', 'Last Active', obj.last_active))
-            timeline_divs = []
-            for icon, label, timestamp in sorted(events, key=lambda x: x[2], reverse=True):
-                timeline_divs.append(
-                    f'<div style="display: flex; align-items: start; margin-bottom: 10px;">'
-                    f'<div style="font-size: 16px; margin-right: 10px;">{icon}</div>'
-                    f'<div><div>{label}</div><small style="color: #666;">{timestamp.strftime("%b %d, %Y %H:%M")}</small></div>'
-                    f'</div>'
+            timeline_divs = format_html_join(
+                '',
+                '<div style="display: flex; align-items: start; margin-bottom: 10px;">'
+                '<div style="font-size: 16px; margin-right: 10px;">{}</div>'
+                '<div><div>{}</div><small style="color: #666;">{}</small></div>'
+                '</div>',
+                (
+                    (icon, label, timestamp.strftime("%b %d, %Y %H:%M"))
+                    for icon, label, timestamp in sorted(events, key=lambda x: x[2], reverse=True)
                 )
+            )
             return format_html(
                 '<div style="background: #fff8e1; padding: 15px; border-radius: 8px; margin-bottom: 20px;">'
                 '<h4 style="margin-top: 0;">Application Timeline</h4>'
                 '{}</div>',
-                format_html(''.join(timeline_divs))
+                timeline_divs
             )
         return format_html('<p>Save the application to see timeline</p>')
     application_timeline.short_description = ''
@@ -430,86 +509,115 @@ class ApplicationAdmin(admin.ModelAdmin):
 
     def interview_history(self, obj):
         if obj.pk:
-            interviews = obj.interviews.all()
+            # Latest five only, and none of the feedback/notes text
+            interviews = list(
+                obj.interviews.order_by('-scheduled_date')
+                .only('application', 'scheduled_date', 'status', 'interview_type')[:5]
+            )
             if interviews:
-                history_divs = []
-                for interview in interviews[:5]:
-                    status_color = {
-                        'scheduled': '#17a2b8',
-                        'completed': '#28a745',
-                        'cancelled': '#dc3545',
-                        'rescheduled': '#ffc107',
-                    }.get(interview.status, '#6c757d')
-                    history_divs.append(
-                        f'<div style="background: white; border: 1px solid #dee2e6; border-radius: 5px; padding: 10px; margin-bottom: 10px;">'
-                        f'<h6 style="margin-top: 0; margin-bottom: 5px;">{interview.scheduled_date.strftime("%b %d, %Y %I:%M %p")}</h6>'
-                        f'<p style="margin-bottom: 5px;">'
-                        f'<span style="background-color: {status_color}; color: white; padding: 2px 6px; border-radius: 10px; font-size: 11px;">{interview.get_status_display()}</span>'
-                        f'<span style="background-color: #6c757d; color: white; padding: 2px 6px; border-radius: 10px; font-size: 11px; margin-left: 5px;">{interview.get_interview_type_display()}</span>'
-                        f'</p></div>'
+                history_divs = format_html_join(
+                    '',
+                    '<div style="background: white; border: 1px solid #dee2e6; border-radius: 5px; padding: 10px; margin-bottom: 10px;">'
+                    '<h6 style="margin-top: 0; margin-bottom: 5px;">{}</h6>'
+                    '<p style="margin-bottom: 5px;">'
+                    '<span style="background-color: {}; color: white; padding: 2px 6px; border-radius: 10px; font-size: 11px;">{}</span>'
+                    '<span style="background-color: #6c757d; color: white; padding: 2px 6px; border-radius: 10px; font-size: 11px; margin-left: 5px;">{}</span>'
+                    '</p></div>',
+                    (
+                        (
+                            interview.scheduled_date.strftime("%b %d, %Y %I:%M %p"),
+                            _INTERVIEW_STATUS_COLORS.get(interview.status, _DEFAULT_BADGE_COLOR),
+                            interview.get_status_display(),
+                            interview.get_interview_type_display(),
+                        )
+                        for interview in interviews
                     )
+                )
                 return format_html(
                     '<div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin-bottom: 20px;">'
                     '<h4 style="margin-top: 0;">Interview History</h4>{}</div>',
-                    format_html(''.join(history_divs))
+                    history_divs
                 )
             return format_html('<p style="color: #666;">No interviews scheduled</p>')
         return format_html('<p>Save the application to see interview history</p>')
     interview_history.short_description = ''
 
+    def _update_status(self, queryset, status):
+        """Bulk status UPDATE; it skips post_save, so drop the affected dashboards here"""
+        recruiter_ids = []
+        if settings.DASHBOARD_CACHE_TIMEOUT:
+            # Read before the UPDATE – a status filter may no longer match after it
+            recruiter_ids = set(queryset.values_list('job__recruiter_id', flat=True))
+        updated = queryset.update(status=status)
+        invalidate_recruiter_dashboards(recruiter_ids)
+        return updated
+
     # Actions
     @admin.action(description="Mark as shortlisted")
     def mark_as_shortlisted(self, request, queryset):
-        updated = queryset.update(status='shortlisted')
+        updated = self._update_status(queryset, 'shortlisted')
         self.message_user(request, f'{updated} application(s) marked as shortlisted.')
 
     @admin.action(description="Mark for interview")
     def mark_as_interview(self, request, queryset):
-        updated = queryset.update(status='interview')
+        updated = self._update_status(queryset, 'interview')
         self.message_user(request, f'{updated} application(s) marked for interview.')
 
     @admin.action(description="Mark as rejected")
     def mark_as_rejected(self, request, queryset):
-        updated = queryset.update(status='rejected')
+        updated = self._update_status(queryset, 'rejected')
         self.message_user(request, f'{updated} application(s) rejected.')
 
     @admin.action(description="Mark as hired")
     def mark_as_hired(self, request, queryset):
-        for app in queryset:
+        # Saved one by one on purpose: post_save sends the candidate's status-change notification
+        applications = list(queryset)
+        hired_date = timezone.now()
+        for app in applications:
             app.status = 'hired'
-            app.hired_date = timezone.now()
-            app.save()
-        self.message_user(request, f'{queryset.count()} candidate(s) hired.')
+            app.hired_date = hired_date
+            app.save(update_fields=['status', 'hired_date'])
+        self.message_user(request, f'{len(applications)} candidate(s) hired.')
 
     @admin.action(description="Toggle favorite")
     def toggle_favorite(self, request, queryset):
-        for app in queryset:
-            app.is_favorite = not app.is_favorite
-            app.save()
-        self.message_user(request, f'{queryset.count()} application(s) favorite status toggled.')
+        updated = queryset.update(is_favorite=~F('is_favorite'))
+        self.message_user(request, f'{updated} application(s) favorite status toggled.')
 
     @admin.action(description="Export to CSV")
     def export_applications_csv(self, request, queryset):
         import csv
-        from django.http import HttpResponse
-        response = HttpResponse(content_type='text/csv')
+        from django.http import StreamingHttpResponse
+
+        class Echo:
+            """File-like object whose write() hands the formatted line back"""
+            def write(self, value):
+                return value
+
+        writer = csv.writer(Echo())
+
+        def rows():
+            yield writer.writerow(['ID', 'Candidate', 'Email', 'Job Title', 'Company', 'Status', 'Match Score', 'Applied Date', 'Rating'])
+            # Plain tuples streamed in chunks – no model instances for large selections
+            for (app_id, first_name, last_name, email, job_title, company_name,
+                 status, match_score, applied_at, rating) in queryset.values_list(
+                    'id', 'seeker__user__first_name', 'seeker__user__last_name', 'seeker__user__email',
+                    'job__title', 'job__recruiter__company__name', 'status', 'match_score',
+                    'applied_at', 'recruiter_rating').iterator(chunk_size=2000):
+                yield writer.writerow([
+                    app_id,
+                    f"{first_name} {last_name}",
+                    email,
+                    job_title,
+                    company_name or '',
+                    Application.STATUS_DISPLAY.get(status, status),
+                    match_score,
+                    applied_at.strftime('%Y-%m-%d'),
+                    rating or ''
+                ])
+
+        response = StreamingHttpResponse(rows(), content_type='text/csv')
         response['Content-Disposition'] = 'attachment; filename="applications_export.csv"'
-        writer = csv.writer(response)
-        writer.writerow(['ID', 'Candidate', 'Email', 'Job Title', 'Company', 'Status', 'Match Score', 'Applied Date', 'Rating'])
-        for app in queryset:
-            # Use safe display helper
-            status_display = self.get_status_display_safe(app)
-            writer.writerow([
-                app.id,
-                f"{app.seeker.user.first_name} {app.seeker.user.last_name}",
-                app.seeker.user.email,
-                app.job.title,
-                app.job.recruiter.company.name if app.job.recruiter.company else '',
-                status_display,
-                app.match_score,
-                app.applied_at.strftime('%Y-%m-%d'),
-                app.recruiter_rating or ''
-            ])
         return response
 
     def get_queryset(self, request):
@@ -523,15 +631,15 @@ class ApplicationAdmin(admin.ModelAdmin):
                 )
             )
         )
+        # No reverse prefetches: the changelist never renders them, and on the
+        # change page the inlines run their own queries anyway
+        if is_changelist(request):
+            # Only the columns list_display renders – skips cover letters, notes, JSON blobs
+            return qs.select_related('seeker__user', 'job__recruiter__company').only(*self.changelist_fields)
         return qs.select_related(
             'seeker__user',
             'job__recruiter__company',
             'job__recruiter__user'
-        ).prefetch_related(
-            'interviews',
-            'notes',
-            'tags',
-            'communications'
         )
 
 
@@ -539,7 +647,7 @@ class ApplicationAdmin(admin.ModelAdmin):
 @admin.register(ApplicationNote)
 class ApplicationNoteAdmin(admin.ModelAdmin):
     list_display = ('id', 'application_link', 'recruiter_link', 'note_preview', 'privacy_badge', 'created_at')
-    list_filter = ('is_private', 'created_at', 'recruiter')
+    list_filter = ('is_private', 'created_at', ('recruiter', RecruiterListFilter))
     search_fields = ('note', 'application__seeker__user__email', 'recruiter__user__email')
     readonly_fields = ('application_details', 'recruiter_details', 'created_at_display')
     fieldsets = (
@@ -550,6 +658,7 @@ class ApplicationNoteAdmin(admin.ModelAdmin):
     )
     list_per_page = 25
     date_hierarchy = 'created_at'
+    paginator = FasterAdminPaginator
     show_full_result_count = False
 
     def has_add_permission(self, request):
@@ -647,6 +756,7 @@ class InterviewAdmin(admin.ModelAdmin):
     )
     list_per_page = 25
     date_hierarchy = 'scheduled_date'
+    paginator = FasterAdminPaginator
     show_full_result_count = False
 
     def has_add_permission(self, request):
@@ -671,17 +781,13 @@ class InterviewAdmin(admin.ModelAdmin):
     candidate_info.short_description = 'Candidate'
 
     def interview_type_badge(self, obj):
-        type_colors = {'phone': '#17a2b8', 'video': '#007bff', 'onsite': '#ffc107', 'technical': '#dc3545'}
-        color = type_colors.get(obj.interview_type, '#6c757d')
-        return format_html('<span style="background-color: {}; color: white; padding: 3px 8px; border-radius: 12px; font-size: 11px;">{}</span>',
-                           color, obj.get_interview_type_display())
+        return _INTERVIEW_TYPE_HTML.get(obj.interview_type) or format_html(
+            _BADGE_HTML, _DEFAULT_BADGE_COLOR, obj.get_interview_type_display())
     interview_type_badge.short_description = 'Type'
 
     def status_badge(self, obj):
-        status_colors = {'scheduled': '#17a2b8', 'completed': '#28a745', 'cancelled': '#dc3545', 'rescheduled': '#ffc107'}
-        color = status_colors.get(obj.status, '#6c757d')
-        return format_html('<span style="background-color: {}; color: white; padding: 3px 8px; border-radius: 12px; font-size: 11px;">{}</span>',
-                           color, obj.get_status_display())
+        return _INTERVIEW_STATUS_HTML.get(obj.status) or format_html(
+            _BADGE_HTML, _DEFAULT_BADGE_COLOR, obj.get_status_display())
     status_badge.short_description = 'Status'
 
     def has_feedback(self, obj):
@@ -764,7 +870,7 @@ class InterviewAdmin(admin.ModelAdmin):
 @admin.register(CandidateTag)
 class CandidateTagAdmin(admin.ModelAdmin):
     list_display = ('tag_display', 'application_link', 'candidate_info', 'created_by_link', 'created_at')
-    list_filter = ('created_at', 'created_by')
+    list_filter = ('created_at', ('created_by', RecruiterListFilter))
     search_fields = ('tag', 'application__seeker__user__email', 'created_by__user__email')
     readonly_fields = ('application_details', 'creator_details', 'created_at_display')
     fieldsets = (
@@ -861,7 +967,7 @@ class CandidateTagAdmin(admin.ModelAdmin):
 @admin.register(CandidateCommunication)
 class CandidateCommunicationAdmin(admin.ModelAdmin):
     list_display = ('id', 'application_link', 'type_badge', 'subject_preview', 'direction_badge', 'sent_at', 'recruiter_link')
-    list_filter = ('communication_type', 'is_outgoing', 'sent_at', 'recruiter')
+    list_filter = ('communication_type', 'is_outgoing', 'sent_at', ('recruiter', RecruiterListFilter))
     search_fields = ('subject', 'content', 'application__seeker__user__email', 'recruiter__user__email')
     readonly_fields = ('application_details', 'communication_content', 'recruiter_details', 'sent_at_display')
     fieldsets = (
@@ -892,10 +998,8 @@ class CandidateCommunicationAdmin(admin.ModelAdmin):
     application_link.short_description = 'Application'
 
     def type_badge(self, obj):
-        type_colors = {'email': '#007bff', 'call': '#17a2b8', 'message': '#28a745', 'interview': '#ffc107', 'offer': '#dc3545'}
-        color = type_colors.get(obj.communication_type, '#6c757d')
-        return format_html('<span style="background-color: {}; color: white; padding: 3px 8px; border-radius: 12px; font-size: 11px;">{}</span>',
-                           color, obj.get_communication_type_display())
+        return _COMMUNICATION_TYPE_HTML.get(obj.communication_type) or format_html(
+            _BADGE_HTML, _DEFAULT_BADGE_COLOR, obj.get_communication_type_display())
     type_badge.short_description = 'Type'
 
     def subject_preview(self, obj):
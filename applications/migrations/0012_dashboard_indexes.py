@@ -0,0 +1,21 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0011_interview_notification_reminder_sent_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', '-applied_at'], name='app_job_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(condition=models.Q(('status', 'scheduled')), fields=['application', 'scheduled_date'], name='interview_scheduled_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.27 on 2026-10-15 23:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0012_dashboard_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['-applied_at'], name='app_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['is_archived', '-applied_at'], name='app_archived_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['scheduled_date'], name='interview_date_idx'),
+        ),
+    ]
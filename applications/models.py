@@ -83,6 +83,11 @@ class Application(models.Model):
             models.Index(fields=['status', '-applied_at']),
             models.Index(fields=['match_score', '-applied_at']),
             models.Index(fields=['job', 'status']),
+            # Recruiter dashboards filter by job and applied_at range / recency
+            models.Index(fields=['job', '-applied_at'], name='app_job_applied_idx'),
+            # Admin changelist: default ordering and the archived filter
+            models.Index(fields=['-applied_at'], name='app_applied_idx'),
+            models.Index(fields=['is_archived', '-applied_at'], name='app_archived_applied_idx'),
         ]
 
     def __str__(self):
@@ -118,21 +123,23 @@ class Application(models.Model):
         # Now delete the application
         super().delete(*args, **kwargs)
     
+    # Human-readable status with proper capitalization (statuses missing here display as-is)
+    STATUS_DISPLAY = {
+        'new': 'New',
+        'pending': 'Pending',
+        'reviewed': 'Reviewed',
+        'shortlisted': 'Shortlisted',
+        'interview': 'Interview',
+        'offer': 'Offer',
+        'rejected': 'Rejected',
+        'accepted': 'Accepted',
+        'hired' : 'Hired'
+    }
+
     @property
     def get_status_display(self):
         """Return human-readable status with proper capitalization"""
-        status_map = {
-            'new': 'New',
-            'pending': 'Pending',
-            'reviewed': 'Reviewed',
-            'shortlisted': 'Shortlisted',
-            'interview': 'Interview',
-            'offer': 'Offer',
-            'rejected': 'Rejected',
-            'accepted': 'Accepted',
-            'hired' : 'Hired'
-        }
-        return status_map.get(self.status, self.status)
+        return self.STATUS_DISPLAY.get(self.status, self.status)
     
     @property
     def candidate_name(self):
@@ -260,6 +267,14 @@ class Interview(models.Model):
         ordering = ['scheduled_date']
         indexes = [
             models.Index(fields=['status', 'scheduled_date', 'notification_reminder_sent']),
+            # Admin changelist ordering / date hierarchy
+            models.Index(fields=['scheduled_date'], name='interview_date_idx'),
+            # Partial index: dashboards only count scheduled interviews
+            models.Index(
+                fields=['application', 'scheduled_date'],
+                name='interview_scheduled_idx',
+                condition=models.Q(status='scheduled'),
+            ),
         ]
     
     def __str__(self):
@@ -205,6 +205,7 @@ class ConversationListSerializer(serializers.ModelSerializer):
                 
                 # Get online status
                 is_online = other_user.get_online_status()
+                last_activity = other_user.get_last_activity()
                 
                 result = {
                     'id': other.id,
@@ -213,7 +214,7 @@ class ConversationListSerializer(serializers.ModelSerializer):
                     'email': other_user.email,
                     'type': participant_type,
                     'is_online': is_online,
-                    'last_activity': other_user.last_activity.isoformat() if other_user.last_activity else None
+                    'last_activity': last_activity.isoformat() if last_activity else None
                 }
                 
                 # Add job seeker specific fields
@@ -237,6 +238,7 @@ class ConversationListSerializer(serializers.ModelSerializer):
                 
                 # Get online status
                 is_online = other_user.get_online_status()
+                last_activity = other_user.get_last_activity()
                 
                 result = {
                     'id': other.id,
@@ -245,7 +247,7 @@ class ConversationListSerializer(serializers.ModelSerializer):
                     'email': other_user.email,
                     'type': participant_type,
                     'is_online': is_online,
-                    'last_activity': other_user.last_activity.isoformat() if other_user.last_activity else None
+                    'last_activity': last_activity.isoformat() if last_activity else None
                 }
                 
                 # Add company info if available
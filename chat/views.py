@@ -289,11 +289,12 @@ def get_user_online_status(request, user_id):
             user.save(update_fields=['is_online'])
             logger.debug(f"User {user_id} online status corrected to offline")
         
-        # Format last activity for display
+        # Format last activity for display (buffered activity is newer than the column)
+        last_activity = user.get_last_activity()
         last_activity_display = None
-        if hasattr(user, 'last_activity') and user.last_activity:
+        if last_activity:
             now = timezone.now()
-            diff = now - user.last_activity
+            diff = now - last_activity
             seconds = diff.total_seconds()
             
             if seconds < 60:
@@ -308,11 +309,11 @@ def get_user_online_status(request, user_id):
                 days = int(seconds / 86400)
                 last_activity_display = f"{days} day{'s' if days != 1 else ''} ago"
             else:
-                last_activity_display = user.last_activity.strftime('%b %d, %Y')
+                last_activity_display = last_activity.strftime('%b %d, %Y')
         
         response_data = {
             'is_online': is_online,
-            'last_activity': user.last_activity.isoformat() if hasattr(user, 'last_activity') and user.last_activity else None,
+            'last_activity': last_activity.isoformat() if last_activity else None,
             'last_activity_display': last_activity_display,
             'status': 'online' if is_online else 'offline'
         }
@@ -338,23 +339,24 @@ def get_users_online_status(request):
         logger.debug("No user IDs provided for batch status")
         return Response({})
     
-    users = User.objects.filter(id__in=user_ids)
+    # online_now is computed in SQL; only users it rules out need the cache check
+    users = User.with_online_flag(User.objects.filter(id__in=user_ids))
     status_data = {}
+    went_offline = []
     
     for user in users:
-        is_online = user.get_online_status() if hasattr(user, 'get_online_status') else False
+        is_online = user.online_now or user.get_online_status()
         
         # Update if needed
-        if hasattr(user, 'is_online') and user.is_online and not is_online:
-            user.is_online = False
-            user.save(update_fields=['is_online'])
-            logger.debug(f"User {user.id} online status corrected to offline")
+        if user.is_online and not is_online:
+            went_offline.append(user.id)
         
         # Format last activity
+        last_activity = user.get_last_activity()
         last_activity_display = None
-        if hasattr(user, 'last_activity') and user.last_activity:
+        if last_activity:
             now = timezone.now()
-            diff = now - user.last_activity
+            diff = now - last_activity
             seconds = diff.total_seconds()
             
             if seconds < 60:
@@ -371,9 +373,13 @@ def get_users_online_status(request):
         
         status_data[str(user.id)] = {
             'is_online': is_online,
-            'last_activity': user.last_activity.isoformat() if hasattr(user, 'last_activity') and user.last_activity else None,
+            'last_activity': last_activity.isoformat() if last_activity else None,
             'last_activity_display': last_activity_display
         }
     
+    if went_offline:
+        User.objects.filter(id__in=went_offline).update(is_online=False)
+        logger.debug(f"Online status corrected to offline for {len(went_offline)} users")
+    
     logger.info(f"Batch online status retrieved - User ID: {request.user.id}, Success count: {len(status_data)}")
     return Response(status_data)
\ No newline at end of file
@@ -9,6 +9,7 @@ class Company(models.Model):
     industry = models.CharField(max_length=100, help_text="e.g. Technology, Healthcare")
     location = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     # New fields for detailed company profile
     tagline = models.CharField(max_length=255, blank=True, help_text="Company tagline")
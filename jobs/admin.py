@@ -1,7 +1,9 @@
+from django.conf import settings
 from django.contrib import admin
 from django.utils.html import format_html, format_html_join
 from django.urls import reverse
 from django.db.models import Count, Q
+from analytics.services import invalidate_recruiter_dashboards
 from .models import JobSkill, Department, Job
 
 
@@ -195,13 +197,28 @@ class DepartmentAdmin(admin.ModelAdmin):
             featured_jobs=Count('jobs', filter=Q(jobs__is_featured=True))
         ).order_by('-total_jobs', 'name')
 
+    def _set_active(self, queryset, is_active):
+        """Bulk is_active UPDATE; it skips post_save, so drop the dashboards of recruiters hiring in these departments"""
+        # order_by(): the changelist orders by the total_jobs annotation, which
+        # neither the pk lookup nor the UPDATE can resolve
+        queryset = queryset.order_by()
+        recruiter_ids = []
+        if settings.DASHBOARD_CACHE_TIMEOUT:
+            department_ids = list(queryset.values_list('pk', flat=True))
+            recruiter_ids = set(
+                Job.objects.filter(department_id__in=department_ids).values_list('recruiter_id', flat=True)
+            )
+        updated = queryset.update(is_active=is_active)
+        invalidate_recruiter_dashboards(recruiter_ids)
+        return updated
+
     def activate_departments(self, request, queryset):
-        updated = queryset.update(is_active=True)
+        updated = self._set_active(queryset, True)
         self.message_user(request, f'Successfully activated {updated} department(s).', level='success')
     activate_departments.short_description = "Activate selected departments"
 
     def deactivate_departments(self, request, queryset):
-        updated = queryset.update(is_active=False)
+        updated = self._set_active(queryset, False)
         self.message_user(request, f'Successfully deactivated {updated} department(s).', level='success')
     deactivate_departments.short_description = "Deactivate selected departments"
 
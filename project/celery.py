@@ -38,6 +38,11 @@ app.conf.beat_schedule = {
         'task': 'notifications.tasks.cleanup_old_notifications',
         'schedule': crontab(hour=3, minute=0, day_of_week=0),  # Sunday 3 AM
     },
+    # Flush buffered activity and mark idle users offline (every 5 minutes)
+    'cleanup-online-status': {
+        'task': 'accounts.tasks.cleanup_online_status',
+        'schedule': crontab(minute='*/5'),
+    },
     # Batch processing (optional)
     'process-notification-batch': {
         'task': 'notifications.tasks.process_notification_batch',
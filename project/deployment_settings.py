@@ -55,6 +55,9 @@ DATABASES = {
     "default": dj_database_url.config(
         default=os.environ.get("DATABASE_URL"),
         conn_max_age=600,
+        # Persistent connections are re-used across requests; ping them first
+        # so one dropped by the server doesn't fail the next request
+        conn_health_checks=True,
         ssl_require=True
     )
 }
@@ -134,9 +134,46 @@ DATABASES = {
         'PASSWORD':'postgres',
         'HOST': 'localhost',
         'PORT':'5433',
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Cache
+# Redis is shared across processes, so activity buffered by the middleware is
+# visible to the cleanup_online_status command. Falls back to local memory.
+REDIS_URL = os.environ.get('REDIS_URL')
+# Only a shared cache is seen by every worker and management command; cache
+# entries that other processes must read or invalidate depend on it
+CACHE_IS_SHARED = bool(REDIS_URL)
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds to cache the /recruiter/me/ payload (0 = disabled). Entries are dropped
+# when the recruiter, their user or company is saved, which only reaches every
+# worker through a shared cache – so it defaults to off without one.
+CURRENT_RECRUITER_CACHE_TIMEOUT = int(os.environ.get('CURRENT_RECRUITER_CACHE_TIMEOUT', 300 if CACHE_IS_SHARED else 0))
+
+# Seconds to cache public recruiter profile responses (0 = disabled).
+# Entries are also dropped when the recruiter, their user or company is saved.
+PUBLIC_RECRUITER_CACHE_TIMEOUT = int(os.environ.get('PUBLIC_RECRUITER_CACHE_TIMEOUT', 0))
+
+# Seconds to cache recruiter dashboard stats and analytics overviews (0 = disabled).
+# Entries are also dropped when the recruiter's jobs, applications, interviews or
+# conversations change – across workers only with a shared cache, hence off without one.
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get('DASHBOARD_CACHE_TIMEOUT', 120 if CACHE_IS_SHARED else 0))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -157,6 +194,18 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Argon2id is much cheaper per login than PBKDF2 at Django's default
+# iteration count. The PBKDF2 hashers stay listed so existing hashes still
+# verify and are upgraded to Argon2 on the user's next login.
+PASSWORD_HASHERS = [
+    'accounts.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 